@@ -6,17 +6,22 @@ Clutch.co and Sortlist.com with automatic email discovery.
 
 import logging
 import os
+import re
 import time
 import threading
 import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
 
 import pandas as pd
 import streamlit as st
 
 from config.categories import get_category_url, get_categories
+from scrapers.base import BaseScraper
 from scrapers.clutch import ClutchScraper
 from scrapers.sortlist import SortlistScraper
-from extractors.email_extractor import EmailExtractor
+from extractors.email_extractor import EmailExtractor, prefetch_emails
 from utils.export import to_csv, to_excel
 
 # Configure logging
@@ -26,6 +31,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+LOG_HISTORY = 200  # activity log lines kept in session state
+EMAIL_WINDOW = 8  # scraped companies whose websites are prefetched together
+PENDING_EMAIL = ""  # email cell of a row shown before its lookup finishes
+
+# Anti-bot page markers, matched in a single case-insensitive scan
+_BLOCK_MARKERS = re.compile(
+    r"cf-browser-verification|cloudflare|recaptcha|captcha|access denied|403",
+    re.IGNORECASE,
+)
+_BLOCK_KINDS = {
+    "cf-browser-verification": "cloudflare",
+    "cloudflare": "cloudflare",
+    "recaptcha": "captcha",
+    "captcha": "captcha",
+    "access denied": "403",
+    "403": "403",
+}
+
 # Page config
 st.set_page_config(
     page_title="Scraping-Emails",
@@ -36,25 +59,26 @@ st.set_page_config(
 
 # ── Thread-safe shared state ────────────────────────────────────────
 # Use a queue so the background thread can push results without touching
-# st.session_state (which is NOT thread-safe for writes).
+# st.session_state (which is NOT thread-safe for writes). Result items are
+# (row_id, fields): the first item for an id is a new row, later ones update it.
 
 if "result_queue" not in st.session_state:
-    st.session_state.result_queue = queue.Queue()
+    st.session_state.result_queue = queue.SimpleQueue()
 
 if "log_queue" not in st.session_state:
-    st.session_state.log_queue = queue.Queue()
+    st.session_state.log_queue = queue.SimpleQueue()
 
 
 def init_session_state():
     """Initialize session state variables."""
     defaults = {
-        "rows": [],           # list of dicts (thread-safe via queue drain)
+        "df": pd.DataFrame(),  # results so far (appended on queue drain)
         "scraping": False,
         "completed": False,
         "stop_event": threading.Event(),
         "total_scraped": 0,
         "total_emails_found": 0,
-        "log_messages": [],
+        "log_messages": deque(maxlen=LOG_HISTORY),
         "scraper_thread": None,
     }
     for key, value in defaults.items():
@@ -62,41 +86,67 @@ def init_session_state():
             st.session_state[key] = value
 
 
+def _drain(q: queue.SimpleQueue) -> list:
+    """Return every item currently in q without blocking.
+
+    Only the main thread consumes, so qsize() items are guaranteed present.
+    """
+    return [q.get_nowait() for _ in range(q.qsize())]
+
+
 def drain_queues():
     """Pull all pending results and log messages from the background thread.
 
     This is the ONLY place we mutate session_state with data from the thread.
     Called once per Streamlit rerun on the main thread.
     """
-    changed = False
-
-    # Drain results
-    while True:
-        try:
-            row = st.session_state.result_queue.get_nowait()
-        except queue.Empty:
-            break
-        st.session_state.rows.append(row)
-        st.session_state.total_scraped += 1
-        if row.get("email") and row["email"] != "Unreachable":
-            st.session_state.total_emails_found += 1
-        changed = True
+    # Drain results: new rows first, then email updates (which may target
+    # rows from this same batch)
+    items = _drain(st.session_state.result_queue)
+    rows = {}
+    emails = {}
+    for row_id, fields in items:
+        if row_id in rows or row_id in st.session_state.df.index:
+            emails[row_id] = fields["email"]
+        else:
+            rows[row_id] = fields
+    if rows:
+        batch = pd.DataFrame(list(rows.values()), index=list(rows))
+        df = st.session_state.df
+        st.session_state.df = batch if df.empty else pd.concat([df, batch])
+        st.session_state.total_scraped += len(rows)
+    if emails:
+        # Copy unless concat just made a new frame; _export_bytes caches by identity
+        df = st.session_state.df if rows else st.session_state.df.copy()
+        df.loc[list(emails), "email"] = list(emails.values())
+        st.session_state.df = df
+    found = [row.get("email") for row in rows.values()] + list(emails.values())
+    st.session_state.total_emails_found += sum(
+        1 for email in found if email and email != "Unreachable"
+    )
 
     # Drain log messages
-    while True:
-        try:
-            msg = st.session_state.log_queue.get_nowait()
-        except queue.Empty:
-            break
-        st.session_state.log_messages.append(msg)
-        if len(st.session_state.log_messages) > 200:
-            st.session_state.log_messages = st.session_state.log_messages[-200:]
-        changed = True
+    messages = _drain(st.session_state.log_queue)
+    if messages:
+        st.session_state.log_messages.extend(messages)  # deque evicts the oldest
+
+    return bool(items or messages)
+
 
-    return changed
+def _export_bytes(df: pd.DataFrame) -> tuple[bytes, bytes]:
+    """Return (csv, xlsx) downloads for df, re-serializing only when it changed.
+
+    drain_queues swaps in a new DataFrame whenever rows arrive, so object
+    identity is an exact and free cache key.
+    """
+    cached = st.session_state.get("export_cache")
+    if cached is None or cached[0] is not df:
+        cached = (df, to_csv(df), to_excel(df))
+        st.session_state.export_cache = cached
+    return cached[1], cached[2]
 
 
-def _log(msg: str, log_q: queue.Queue):
+def _log(msg: str, log_q: queue.SimpleQueue):
     """Thread-safe logging: push to queue + Python logger."""
     timestamp = time.strftime("%H:%M:%S")
     log_q.put(f"[{timestamp}] {msg}")
@@ -115,91 +165,181 @@ def get_scraper(site: str, headless: bool | str = True, proxy_server: str = ""):
 
 def run_scraper_thread(
     tasks: list[tuple[str, str, str]],
-    result_q: queue.Queue,
-    log_q: queue.Queue,
+    result_q: queue.SimpleQueue,
+    log_q: queue.SimpleQueue,
     stop_event: threading.Event,
     proxy_server: str = "",
 ):
     """Run scraping in a background thread.
 
+    Each (site, category, url) task gets its own worker thread and browser,
+    so Clutch and Sortlist are scraped concurrently when both are selected.
     Pushes each company dict into result_q as soon as it's ready.
     The main thread drains the queue on every rerun to update the UI.
     """
-    for site, category, url in tasks:
-        if stop_event.is_set():
-            break
+    todo = queue.SimpleQueue()
+    for task in tasks:
+        todo.put(task)
+
+    workers = max(1, len(tasks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in range(workers):
+            pool.submit(_scrape_worker, todo, result_q, log_q, stop_event, proxy_server)
+
+    _log("All scraping tasks complete.", log_q)
+
+
+def _scrape_worker(
+    todo: queue.SimpleQueue,
+    result_q: queue.SimpleQueue,
+    log_q: queue.SimpleQueue,
+    stop_event: threading.Event,
+    proxy_server: str = "",
+):
+    """Run tasks from todo until it is empty, then close this thread's Chromium.
+
+    Playwright objects belong to the thread that made them, so the shared
+    browser is shut down here, once, rather than after every task.
+    """
+    try:
+        while True:
+            try:
+                site, category, url = todo.get_nowait()
+            except queue.Empty:
+                return
+            # _scrape_task reports its own errors; this catches anything that
+            # still escaped, which would otherwise vanish inside the pool
+            try:
+                _scrape_task(site, category, url, result_q, log_q, stop_event, proxy_server)
+            except Exception as e:
+                _log(f"Error during {site} scraping: {e}", log_q)
+                logger.exception("Scraping task for %s failed", site)
+    finally:
+        BaseScraper.shutdown_shared()
+
+
+def _attach_emails(
+    pending: list[tuple[int, str]],
+    email_extractor: EmailExtractor,
+    result_q: queue.SimpleQueue,
+    log_q: queue.SimpleQueue,
+    stop_event: threading.Event,
+):
+    """Look up emails for a window of (row_id, website_url) already pushed
+    to result_q, and push each as an update to its row.
+
+    Sites are checked concurrently over plain HTTP first; only the ones
+    where that finds nothing go through the Playwright page.
+    """
+    if not pending:
+        return
+
+    prefetched = prefetch_emails([website_url for _, website_url in pending])
+    for row_id, website_url in pending:
+        email = prefetched.get(website_url)
+        if not email and not stop_event.is_set():
+            _log(f"  Extracting email from {website_url[:60]}...", log_q)
+            try:
+                email = email_extractor.find_email(website_url, http_first=False)
+            except Exception as e:
+                logger.warning("Email extraction error: %s", e)
+                email = "Unreachable"
+        email = email or "Unreachable"
+        if email != "Unreachable":
+            _log(f"  Email found: {email}", log_q)
+        else:
+            _log(f"  No email found", log_q)
+
+        # Patch the row already shown in the table
+        result_q.put((row_id, {"email": email}))
+
+
+# Row ids are unique across concurrent tasks, so updates find their row
+_row_ids = count()
+
+
+def _scrape_task(
+    site: str,
+    category: str,
+    url: str,
+    result_q: queue.SimpleQueue,
+    log_q: queue.SimpleQueue,
+    stop_event: threading.Event,
+    proxy_server: str = "",
+):
+    """Scrape one site/category with its own browser, streaming rows to result_q.
+
+    Each row is pushed as soon as it is scraped; emails follow as updates once
+    a window of EMAIL_WINDOW sites has been looked up together.
+    """
+    if stop_event.is_set():
+        return
 
+    scraper = None
+    try:
         scraper = get_scraper(site, proxy_server=proxy_server)
-        try:
-            _log(f"Starting {site} scraper for {category}...", log_q)
-            if proxy_server:
-                _log(f"  Using proxy: {proxy_server.split('@')[-1]}", log_q)
-            scraper.start_browser()
-            email_extractor = EmailExtractor(scraper.page)
-            _log(f"Navigating to {url}", log_q)
-
-            company_count = 0
-            for company in scraper.scrape_category(url):
-                if stop_event.is_set():
-                    _log("Stop requested by user. Finishing...", log_q)
-                    break
-
-                company_count += 1
-                _log(f"[{company_count}] Scraped: {company.get('name', 'Unknown')}", log_q)
-
-                # Extract email
-                website_url = company.get("website_url", "")
-                if website_url:
-                    _log(f"  Extracting email from {website_url[:60]}...", log_q)
-                    try:
-                        email = email_extractor.find_email(website_url)
-                    except Exception as e:
-                        logger.warning("Email extraction error: %s", e)
-                        email = "Unreachable"
-                    company["email"] = email
-                    if email != "Unreachable":
-                        _log(f"  Email found: {email}", log_q)
-                    else:
-                        _log(f"  No email found", log_q)
+        _log(f"Starting {site} scraper for {category}...", log_q)
+        if proxy_server:
+            _log(f"  Using proxy: {proxy_server.split('@')[-1]}", log_q)
+        scraper.start_browser()
+        email_extractor = EmailExtractor(scraper.page)
+        _log(f"Navigating to {url}", log_q)
+
+        company_count = 0
+        pending = []
+        for company in scraper.scrape_category(url):
+            if stop_event.is_set():
+                _log("Stop requested by user. Finishing...", log_q)
+                break
+
+            company_count += 1
+            _log(f"[{company_count}] Scraped: {company.get('name', 'Unknown')}", log_q)
+
+            row_id = next(_row_ids)
+            website_url = company.get("website_url", "")
+            if website_url:
+                result_q.put((row_id, {**company, "email": PENDING_EMAIL}))
+                pending.append((row_id, website_url))
+            else:
+                _log(f"  {company.get('name', 'Unknown')}: no website URL — skipping email extraction", log_q)
+                result_q.put((row_id, {**company, "email": "Unreachable"}))
+            if len(pending) >= EMAIL_WINDOW:
+                _attach_emails(pending, email_extractor, result_q, log_q, stop_event)
+                pending = []
+        _attach_emails(pending, email_extractor, result_q, log_q, stop_event)
+
+        # Diagnose empty results
+        if company_count == 0:
+            _log(f"WARNING: 0 companies found on {site}!", log_q)
+            # Capture page title and snippet for debugging
+            try:
+                title = scraper.page.title()
+                _log(f"  Page title: {title}", log_q)
+                # Check for Cloudflare / bot detection
+                content = scraper.page.content()[:2000]
+                kinds = {_BLOCK_KINDS[m.lower()] for m in _BLOCK_MARKERS.findall(content)}
+                if "cloudflare" in kinds:
+                    _log(f"  BLOCKED: Cloudflare anti-bot page detected!", log_q)
+                elif "captcha" in kinds:
+                    _log(f"  BLOCKED: CAPTCHA detected!", log_q)
+                elif "403" in kinds:
+                    _log(f"  BLOCKED: Access denied (403)!", log_q)
                 else:
-                    company["email"] = "Unreachable"
-                    _log(f"  No website URL — skipping email extraction", log_q)
-
-                # Push completed row into queue immediately
-                result_q.put(company)
-
-            # Diagnose empty results
-            if company_count == 0:
-                _log(f"WARNING: 0 companies found on {site}!", log_q)
-                # Capture page title and snippet for debugging
-                try:
-                    title = scraper.page.title()
-                    _log(f"  Page title: {title}", log_q)
-                    # Check for Cloudflare / bot detection
-                    content = scraper.page.content()[:2000]
-                    if "cloudflare" in content.lower() or "cf-browser-verification" in content.lower():
-                        _log(f"  BLOCKED: Cloudflare anti-bot page detected!", log_q)
-                    elif "captcha" in content.lower() or "recaptcha" in content.lower():
-                        _log(f"  BLOCKED: CAPTCHA detected!", log_q)
-                    elif "access denied" in content.lower() or "403" in content.lower():
-                        _log(f"  BLOCKED: Access denied (403)!", log_q)
-                    else:
-                        # Log a snippet of the page to help debug selector issues
-                        text = scraper.page.inner_text("body")[:500]
-                        _log(f"  Page text preview: {text[:300]}", log_q)
-                except Exception as diag_err:
-                    _log(f"  Could not diagnose page: {diag_err}", log_q)
-
-            _log(f"Finished {site}/{category}: {company_count} companies scraped.", log_q)
-
-        except Exception as e:
-            _log(f"Error during {site} scraping: {e}", log_q)
-            logger.exception("Scraping error for %s", site)
-
-        finally:
-            scraper.close_browser()
+                    # Log a snippet of the page to help debug selector issues
+                    text = scraper.page.inner_text("body")[:500]
+                    _log(f"  Page text preview: {text[:300]}", log_q)
+            except Exception as diag_err:
+                _log(f"  Could not diagnose page: {diag_err}", log_q)
 
-    _log("All scraping tasks complete.", log_q)
+        _log(f"Finished {site}/{category}: {company_count} companies scraped.", log_q)
+
+    except Exception as e:
+        _log(f"Error during {site} scraping: {e}", log_q)
+        logger.exception("Scraping error for %s", site)
+
+    finally:
+        if scraper is not None:
+            scraper.close_browser()
 
 
 def main():
@@ -306,17 +446,17 @@ def main():
         # Reset button (shown after completion)
         if st.session_state.completed:
             if st.button("New Scrape", use_container_width=True):
-                st.session_state.rows = []
+                st.session_state.df = pd.DataFrame()
                 st.session_state.scraping = False
                 st.session_state.completed = False
                 st.session_state.stop_event = threading.Event()
                 st.session_state.total_scraped = 0
                 st.session_state.total_emails_found = 0
-                st.session_state.log_messages = []
+                st.session_state.log_messages = deque(maxlen=LOG_HISTORY)
                 st.session_state.scraper_thread = None
                 # Clear queues
-                st.session_state.result_queue = queue.Queue()
-                st.session_state.log_queue = queue.Queue()
+                st.session_state.result_queue = queue.SimpleQueue()
+                st.session_state.log_queue = queue.SimpleQueue()
                 st.rerun()
 
         st.divider()
@@ -331,15 +471,15 @@ def main():
 
     # ── Start scraping ───────────────────────────────────────────────
     if start_clicked and not st.session_state.scraping:
-        st.session_state.rows = []
+        st.session_state.df = pd.DataFrame()
         st.session_state.scraping = True
         st.session_state.completed = False
         st.session_state.stop_event = threading.Event()
         st.session_state.total_scraped = 0
         st.session_state.total_emails_found = 0
-        st.session_state.log_messages = []
-        st.session_state.result_queue = queue.Queue()
-        st.session_state.log_queue = queue.Queue()
+        st.session_state.log_messages = deque(maxlen=LOG_HISTORY)
+        st.session_state.result_queue = queue.SimpleQueue()
+        st.session_state.log_queue = queue.SimpleQueue()
 
         thread = threading.Thread(
             target=run_scraper_thread,
@@ -361,8 +501,10 @@ def main():
         st.info(f"Scraping in progress... {st.session_state.total_scraped} companies found so far.")
 
     # ── Download buttons ─────────────────────────────────────────────
-    if st.session_state.rows:
-        df = pd.DataFrame(st.session_state.rows)
+    if not st.session_state.df.empty:
+        df = st.session_state.df
+
+        csv_bytes, excel_bytes = _export_bytes(df)
 
         st.subheader("Download Results")
         col1, col2 = st.columns(2)
@@ -370,7 +512,7 @@ def main():
             label = "Download CSV" if st.session_state.completed else "Download CSV (So Far)"
             st.download_button(
                 label=label,
-                data=to_csv(df),
+                data=csv_bytes,
                 file_name="scraping_emails_results.csv",
                 mime="text/csv",
                 use_container_width=True,
@@ -379,7 +521,7 @@ def main():
             label = "Download Excel" if st.session_state.completed else "Download Excel (So Far)"
             st.download_button(
                 label=label,
-                data=to_excel(df),
+                data=excel_bytes,
                 file_name="scraping_emails_results.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 use_container_width=True,
@@ -394,11 +536,15 @@ def main():
             horizontal=True,
         )
 
-        display_df = df.copy()
-        if email_filter == "Found" and "email" in display_df.columns:
-            display_df = display_df[display_df["email"] != "Unreachable"]
-        elif email_filter == "Unreachable" and "email" in display_df.columns:
-            display_df = display_df[display_df["email"] == "Unreachable"]
+        # Filter with one boolean mask; "All" shows the frame as-is (no copy).
+        # Rows still awaiting their lookup fall in neither filter.
+        display_df = df
+        if email_filter != "All" and "email" in df.columns:
+            if email_filter == "Found":
+                mask = ~df["email"].isin(("Unreachable", PENDING_EMAIL))
+            else:
+                mask = df["email"].eq("Unreachable")
+            display_df = df[mask.to_numpy()]
 
         st.dataframe(
             display_df,
@@ -424,7 +570,8 @@ def main():
     # ── Activity log ─────────────────────────────────────────────────
     if st.session_state.log_messages:
         with st.expander("Activity Log", expanded=st.session_state.scraping):
-            st.code("\n".join(st.session_state.log_messages[-50:]), language=None)
+            log = st.session_state.log_messages
+            st.code("\n".join(islice(log, max(0, len(log) - 50), None)), language=None)
 
     # ── Auto-refresh while scraping (non-blocking) ───────────────────
     if st.session_state.scraping:
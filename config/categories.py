@@ -1,5 +1,7 @@
 """Site categories and URL mappings for Clutch.co and Sortlist.com."""
 
+from functools import lru_cache
+
 SITES = {
     "Clutch.co": {
         "base_url": "https://clutch.co",
@@ -23,6 +25,7 @@ SITES = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_category_url(site: str, category: str) -> str:
     """Build the full URL for a site + category combination."""
     site_config = SITES[site]
@@ -34,6 +37,11 @@ def get_site_names() -> list[str]:
     return list(SITES.keys())
 
 
-def get_categories(site: str) -> list[str]:
-    """Return available categories for a given site."""
-    return list(SITES[site]["categories"].keys())
+@lru_cache(maxsize=None)
+def get_categories(site: str) -> tuple[str, ...]:
+    """Return available categories for a given site.
+
+    Cached (the Streamlit sidebar asks on every rerun), so the result is an
+    immutable tuple.
+    """
+    return tuple(SITES[site]["categories"].keys())
@@ -2,6 +2,13 @@
 
 import re
 
+# google-re2 scans in linear time with a DFA; fall back to the stdlib
+# backtracking engine when it isn't installed.
+try:
+    import re2 as _email_re
+except ImportError:
+    _email_re = re
+
 # Prefixes we WANT to capture (common business contact emails)
 ALLOWED_PREFIXES = [
     "info",
@@ -72,44 +79,45 @@ BLOCKED_DOMAINS = [
 # File extensions that indicate an image/asset path, not an email
 BLOCKED_EXTENSIONS = [".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".bmp"]
 
-# Regex pattern for extracting email addresses
-EMAIL_REGEX = re.compile(
+# Regex pattern for extracting email addresses (run over whole page bodies)
+EMAIL_REGEX = _email_re.compile(
     r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
 )
 
+# The whole allowlist/blocklist check compiled into one pattern, matched
+# against the lowercased address. Uses lookaheads, so it stays on the
+# stdlib engine rather than re2.
+_VALID_EMAIL_RE = re.compile(
+    # no image/asset extension anywhere in the address
+    r"(?!.*(?:" + "|".join(map(re.escape, BLOCKED_EXTENSIONS)) + r"))"
+    # local part: not a blocked prefix (exact or "prefix."), at least 2 chars
+    r"(?!(?:" + "|".join(map(re.escape, BLOCKED_PREFIXES)) + r")[.@])"
+    r"[a-z0-9._%+\-]{2,}@"
+    # domain: not a blocked platform domain
+    r"(?!(?:" + "|".join(map(re.escape, BLOCKED_DOMAINS)) + r")$)"
+    r"[a-z0-9.\-]+\.[a-z]{2,}"
+)
+_ALLOWED_PREFIX_RE = re.compile(
+    r"(?:" + "|".join(map(re.escape, ALLOWED_PREFIXES)) + r")(?:\.|$)"
+)
 
-def is_valid_email(email: str) -> bool:
-    """Check if an email passes our allowlist/blocklist filters.
-
-    Returns True if the email looks like a legitimate business contact email.
-    """
-    email = email.lower().strip()
-
-    # Basic format check
-    if not EMAIL_REGEX.fullmatch(email):
-        return False
 
-    local_part, domain = email.rsplit("@", 1)
+def _is_valid_lower(email_lower: str) -> bool:
+    """is_valid_email for an address that is already lowercased and stripped."""
+    return _VALID_EMAIL_RE.fullmatch(email_lower) is not None
 
-    # Reject if domain is in blocked list
-    if domain in BLOCKED_DOMAINS:
-        return False
 
-    # Reject if local part matches blocked prefix
-    for prefix in BLOCKED_PREFIXES:
-        if local_part == prefix or local_part.startswith(prefix + "."):
-            return False
+def _is_preferred_local(local_lower: str) -> bool:
+    """is_preferred_email for an already-lowercased local part."""
+    return _ALLOWED_PREFIX_RE.match(local_lower) is not None
 
-    # Reject if it looks like a file path (contains image extension)
-    for ext in BLOCKED_EXTENSIONS:
-        if ext in email:
-            return False
 
-    # Reject very short or suspicious local parts
-    if len(local_part) < 2:
-        return False
+def is_valid_email(email: str) -> bool:
+    """Check if an email passes our allowlist/blocklist filters.
 
-    return True
+    Returns True if the email looks like a legitimate business contact email.
+    """
+    return _is_valid_lower(email.lower().strip())
 
 
 def is_preferred_email(email: str) -> bool:
@@ -117,8 +125,7 @@ def is_preferred_email(email: str) -> bool:
 
     Used to prioritize among multiple valid emails.
     """
-    local_part = email.lower().split("@")[0]
-    return any(local_part == prefix or local_part.startswith(prefix + ".") for prefix in ALLOWED_PREFIXES)
+    return _is_preferred_local(email.lower().partition("@")[0])
 
 
 def extract_emails_from_text(text: str) -> list[str]:
@@ -132,23 +139,25 @@ def filter_and_rank_emails(emails: list[str]) -> str | None:
     Priority:
     1. Preferred prefix emails (info@, contact@, etc.)
     2. Any other valid email
-    """
-    valid = [e for e in emails if is_valid_email(e)]
-    if not valid:
-        return None
 
-    # Deduplicate while preserving order
+    Each candidate is lowercased once and deduplicated before validation.
+    """
     seen = set()
-    unique = []
-    for e in valid:
+    first_valid = None
+    for e in emails:
         lower = e.lower()
-        if lower not in seen:
-            seen.add(lower)
-            unique.append(e)
+        if lower in seen:
+            continue
+        seen.add(lower)
+
+        lower = lower.strip()
+        if not _is_valid_lower(lower):
+            continue
 
-    # Prefer business contact emails
-    preferred = [e for e in unique if is_preferred_email(e)]
-    if preferred:
-        return preferred[0]
+        # Prefer business contact emails
+        if _is_preferred_local(lower.partition("@")[0]):
+            return e
+        if first_valid is None:
+            first_valid = e
 
-    return unique[0]
+    return first_valid
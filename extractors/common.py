@@ -0,0 +1,69 @@
+"""Page helpers shared by the v1 and v2 email extractors."""
+
+from urllib.parse import urlparse
+
+from lxml import html as lxml_html
+
+
+def settle(page, timeout_ms: int) -> None:
+    """Wait until the page's network goes idle, for at most timeout_ms.
+
+    Replaces a fixed sleep: static pages continue as soon as they settle,
+    busy ones are read as-is once the cap is hit.
+    """
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except Exception:
+        pass
+
+
+def site_key(website_url: str) -> str:
+    """Cache key for a website: lowercased host without www, plus the path.
+
+    The path keeps tenants of shared hosts (facebook.com/<page>,
+    linktr.ee/<name>, sites.google.com/...) apart; the query and fragment
+    (usually tracking parameters) are dropped.
+    """
+    parsed = urlparse(website_url)
+    host = parsed.netloc.lower().removeprefix("www.")
+    if not host:
+        return website_url
+    return host + parsed.path.rstrip("/")
+
+
+def contact_rank(path: str) -> int:
+    """Sort rank for a candidate page path: contact, about, team, other."""
+    path = path.lower()
+    if "contact" in path:
+        return 0
+    if "about" in path:
+        return 1
+    if "team" in path:
+        return 2
+    return 3
+
+
+def parse_html(html: str):
+    """Parse a page into an lxml document, or None if it can't be parsed.
+
+    lxml.html keeps one default parser per thread and reuses it, so this
+    is safe to call from the prefetch pool.
+    """
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # XHTML with an <?xml encoding=...?> declaration needs bytes input
+        try:
+            return lxml_html.document_fromstring(html.encode("utf-8"))
+        except Exception:
+            return None
+    except Exception:  # empty or unparseable document
+        return None
+
+
+def iter_links(html: str):
+    """Yield <a href> elements from an lxml tree (C-level parse, no soup)."""
+    doc = parse_html(html)
+    if doc is None:
+        return
+    yield from doc.iterfind(".//a[@href]")
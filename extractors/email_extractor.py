@@ -2,11 +2,13 @@
 
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
-
-from bs4 import BeautifulSoup
+from urllib.request import Request, urlopen
 
 from config.email_filters import extract_emails_from_text, filter_and_rank_emails
+from extractors.common import contact_rank, iter_links, parse_html, settle, site_key
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +20,99 @@ CONTACT_PAGE_PATTERNS = [
     re.compile(r"/(impressum|imprint|legal)", re.IGNORECASE),
 ]
 
+# All of the above as one alternation, so each path costs a single search
+CONTACT_PAGE_RE = re.compile(
+    "|".join(p.pattern for p in CONTACT_PAGE_PATTERNS), re.IGNORECASE
+)
+
 # Link text patterns that suggest a contact page
 CONTACT_LINK_TEXT = re.compile(
     r"\b(contact|about|team|get.in.touch|reach.us|impressum|imprint)\b",
     re.IGNORECASE,
 )
 
+# Plain-HTTP page fetching (no browser)
+STATIC_FETCH_WORKERS = 8
+STATIC_FETCH_TIMEOUT = 10  # seconds
+STATIC_FETCH_MAX_BYTES = 2_000_000
+STATIC_FETCH_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+
+def fetch_html(url: str, timeout: float = STATIC_FETCH_TIMEOUT) -> str | None:
+    """GET a page over plain HTTP; return its HTML, or None on error/non-HTML."""
+    try:
+        request = Request(url, headers=STATIC_FETCH_HEADERS)
+        with urlopen(request, timeout=timeout) as response:
+            if "html" not in response.headers.get("Content-Type", ""):
+                return None
+            charset = response.headers.get_content_charset() or "utf-8"
+            return response.read(STATIC_FETCH_MAX_BYTES).decode(charset, errors="replace")
+    except Exception as e:
+        logger.debug("Static fetch failed for %s: %s", url, e)
+        return None
+
+
+def fetch_static_email(website_url: str) -> str | None:
+    """Look for an email over plain HTTP: landing page, then contact pages.
+
+    Returns None on any network error, non-HTML response, or when the
+    static HTML holds no valid email (e.g. JS-rendered sites).
+    """
+    if not website_url or not website_url.startswith("http"):
+        return None
+
+    html = fetch_html(website_url)
+    if html is None:
+        return None
+
+    email = EmailExtractor._extract_best_email(html)
+    if email:
+        return email
+
+    for contact_url in EmailExtractor._find_contact_page_urls(html, website_url)[:3]:
+        contact_html = fetch_html(contact_url)
+        if contact_html:
+            email = EmailExtractor._extract_best_email(contact_html)
+            if email:
+                return email
+
+    return None
+
+
+def prefetch_emails(
+    website_urls: list[str], max_workers: int = STATIC_FETCH_WORKERS
+) -> dict[str, str | None]:
+    """Run fetch_static_email over many websites concurrently.
+
+    Returns:
+        Mapping of each distinct URL to its email, or None if not found.
+    """
+    unique = list(dict.fromkeys(u for u in website_urls if u))
+    if not unique:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as pool:
+        return dict(zip(unique, pool.map(fetch_static_email, unique)))
+
+
+# "@" written as an HTML entity (zero-padded, hex, or without the trailing
+# ";" that parsers still accept); still an email once the text is decoded
+_AT_ENTITY_RE = re.compile(r"&#0*64;?|&#x0*40;?|&commat;", re.IGNORECASE)
+
+
+def may_contain_email(html: str) -> bool:
+    """Cheap test run before any parsing or regex work.
+
+    A page with no "@" (literal or entity-encoded) holds no plain address.
+    """
+    return "@" in html or _AT_ENTITY_RE.search(html) is not None
+
 
 class EmailExtractor:
     """Extracts email addresses from company websites.
@@ -40,19 +129,25 @@ class EmailExtractor:
             page: A Playwright Page object (from the scraper's Camoufox browser).
         """
         self._page = page
+        # Emails found per site (see site_key); listings often repeat a company
+        # site. Misses aren't stored, so a transient failure can be retried.
+        self._email_by_site: dict[str, str] = {}
 
-    def find_email(self, website_url: str) -> str:
+    def find_email(self, website_url: str, http_first: bool = True) -> str:
         """Visit a company website and try to find a contact email.
 
         Strategy:
-        1. Navigate to the landing page, extract emails from HTML
-        2. If no valid email found, look for contact/about page links
-        3. Visit contact page(s) and extract emails
-        4. Apply allowlist/blocklist filtering
-        5. Return the best email or "Unreachable"
+        1. Try the landing and contact pages over plain HTTP (no browser)
+        2. Navigate to the landing page, extract emails from HTML
+        3. If no valid email found, look for contact/about page links
+        4. Visit contact page(s) and extract emails
+        5. Apply allowlist/blocklist filtering
+        6. Return the best email or "Unreachable"
 
         Args:
             website_url: The company's website URL.
+            http_first: Skip step 1 when False (e.g. the caller already
+                ran fetch_static_email for this site).
 
         Returns:
             A valid email address string, or "Unreachable".
@@ -60,11 +155,24 @@ class EmailExtractor:
         if not website_url or not website_url.startswith("http"):
             return "Unreachable"
 
+        key = site_key(website_url)
+        cached = self._email_by_site.get(key)
+        if cached is not None:
+            logger.info("Reusing result for %s: %s", key, cached)
+            return cached
+
+        email = (fetch_static_email(website_url) if http_first else None) or self._visit_site(website_url)
+        if email != "Unreachable":
+            self._email_by_site[key] = email
+        return email
+
+    def _visit_site(self, website_url: str) -> str:
+        """Run the landing page / contact page search for one website."""
         try:
             # Step 1: Check landing page
             logger.info("Checking landing page: %s", website_url)
             self._page.goto(website_url, wait_until="domcontentloaded", timeout=15000)
-            self._page.wait_for_timeout(2000)  # Let JS render
+            settle(self._page, 2000)  # Let JS render
 
             html = self._page.content()
             email = self._extract_best_email(html)
@@ -78,7 +186,7 @@ class EmailExtractor:
                 try:
                     logger.info("Checking contact page: %s", contact_url)
                     self._page.goto(contact_url, wait_until="domcontentloaded", timeout=10000)
-                    self._page.wait_for_timeout(1500)
+                    settle(self._page, 1500)
 
                     html = self._page.content()
                     email = self._extract_best_email(html)
@@ -96,36 +204,42 @@ class EmailExtractor:
             logger.warning("Error extracting email from %s: %s", website_url, e)
             return "Unreachable"
 
-    def _extract_best_email(self, html: str) -> str | None:
+    @staticmethod
+    def _extract_best_email(html: str) -> str | None:
         """Extract emails from HTML and return the best one.
 
         Combines:
         - mailto: link parsing (highest confidence)
-        - Regex extraction from page text
+        - Regex extraction from the HTML source (covers the visible text too)
+        - Regex extraction from the parsed text, only if nothing else matched
         """
+        if not may_contain_email(html):
+            return None
+
         all_emails = []
+        doc = parse_html(html)
 
         # Parse mailto: links first (highest confidence)
-        soup = BeautifulSoup(html, "lxml")
-        mailto_links = soup.select('a[href^="mailto:"]')
-        for link in mailto_links:
-            href = link.get("href", "")
-            email = href.replace("mailto:", "").split("?")[0].strip()
-            if email:
-                all_emails.append(email)
+        if doc is not None:
+            for href in doc.xpath('//a[starts-with(@href, "mailto:")]/@href'):
+                email = href.replace("mailto:", "").split("?")[0].strip()
+                if email:
+                    all_emails.append(email)
 
-        # Regex extraction from full HTML text
-        text_emails = extract_emails_from_text(soup.get_text())
-        all_emails.extend(text_emails)
-
-        # Also check HTML source for obfuscated emails
-        html_emails = extract_emails_from_text(html)
-        all_emails.extend(html_emails)
+        # One regex pass over the source, which contains the page text
+        all_emails.extend(extract_emails_from_text(html))
 
         # Filter and rank
-        return filter_and_rank_emails(all_emails)
+        email = filter_and_rank_emails(all_emails)
+        if email or doc is None:
+            return email
+
+        # Addresses split by inline tags or written with entities only show
+        # up in the extracted text
+        return filter_and_rank_emails(extract_emails_from_text(doc.text_content()))
 
-    def _find_contact_page_urls(self, html: str, base_url: str) -> list[str]:
+    @staticmethod
+    def _find_contact_page_urls(html: str, base_url: str) -> list[str]:
         """Find URLs that likely lead to contact or about pages.
 
         Args:
@@ -135,52 +249,40 @@ class EmailExtractor:
         Returns:
             List of absolute URLs to check, ordered by likelihood.
         """
-        soup = BeautifulSoup(html, "lxml")
         candidates = []
         base_domain = urlparse(base_url).netloc
 
-        for a_tag in soup.find_all("a", href=True):
+        # Walk links on a bare lxml tree; no BeautifulSoup wrapper needed here
+        for a_tag in iter_links(html):
             href = a_tag.get("href", "").strip()
             if not href or href.startswith("#") or href.startswith("javascript:"):
                 continue
 
             full_url = urljoin(base_url, href)
+            parsed = urlparse(full_url)
 
             # Only follow links on the same domain
-            if urlparse(full_url).netloc != base_domain:
+            if parsed.netloc != base_domain:
                 continue
 
-            # Check if URL path matches contact page patterns
-            path = urlparse(full_url).path
-            for pattern in CONTACT_PAGE_PATTERNS:
-                if pattern.search(path):
-                    candidates.append(full_url)
-                    break
+            # Check if URL path matches contact page patterns, else link text
+            path = parsed.path
+            if CONTACT_PAGE_RE.search(path):
+                candidates.append((full_url, path))
             else:
-                # Check link text
-                link_text = a_tag.get_text(strip=True)
+                link_text = a_tag.text_content().strip()
                 if link_text and CONTACT_LINK_TEXT.search(link_text):
-                    candidates.append(full_url)
+                    candidates.append((full_url, path))
 
-        # Deduplicate while preserving order
+        # Deduplicate while preserving order, ranking from the parsed path
         seen = set()
-        unique = []
-        for url in candidates:
+        ranked = []
+        for url, path in candidates:
             normalized = url.rstrip("/").lower()
             if normalized not in seen:
                 seen.add(normalized)
-                unique.append(url)
-
-        # Prioritize: contact pages first, then about, then team
-        def sort_key(u):
-            path = urlparse(u).path.lower()
-            if "contact" in path:
-                return 0
-            if "about" in path:
-                return 1
-            if "team" in path:
-                return 2
-            return 3
-
-        unique.sort(key=sort_key)
-        return unique
+                ranked.append((contact_rank(path), url))
+
+        # Prioritize: contact pages first, then about, then team (stable sort)
+        ranked.sort(key=itemgetter(0))
+        return [url for _, url in ranked]
@@ -5,8 +5,10 @@ Supports two browser backends controlled by the BROWSER_ENGINE env var:
   - "camoufox": Camoufox (Firefox antidetect) — stealthier, best on Linux/Docker.
 """
 
+import atexit
 import os
 import random
+import threading
 import time
 import logging
 from typing import Generator
@@ -18,6 +20,33 @@ logger = logging.getLogger(__name__)
 
 BROWSER_ENGINE = os.environ.get("BROWSER_ENGINE", "playwright").lower()
 
+# SCRAPER_FAST=1 skips the human-like random pauses (only where anti-bot
+# pacing doesn't matter, e.g. local test pages)
+SCRAPER_FAST = os.environ.get("SCRAPER_FAST", "").lower() in ("1", "true", "yes")
+
+# Resource types no scraper reads; aborting them cuts page weight and load time
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Third-party analytics/ad hosts; matched as substrings of the request URL
+BLOCKED_URL_PARTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "facebook.net",
+)
+
+
+def _block_heavy_resources(route) -> None:
+    """Playwright route handler: abort images/media/fonts and trackers, pass the rest."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
 
 def _try_import_camoufox():
     """Import Camoufox only when needed (avoids hangs on unsupported platforms)."""
@@ -29,6 +58,57 @@ def _try_import_camoufox():
         return None
 
 
+# Backend resolved once at import: the Camoufox class, or None for Playwright
+_CAMOUFOX = _try_import_camoufox() if BROWSER_ENGINE == "camoufox" else None
+
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+]
+
+# Sync Playwright objects belong to the thread that created them, so the
+# shared Chromium is per thread: scrapers started one after another on the
+# same thread reuse it and only open/close their own BrowserContext.
+_shared = threading.local()
+
+
+def _shared_chromium(headless: bool):
+    """Return this thread's Chromium, launching Playwright on first use."""
+    browser = getattr(_shared, "browser", None)
+    if browser is not None and browser.is_connected() and _shared.headless == headless:
+        return browser
+
+    _shutdown_shared_chromium()
+    _shared.playwright = sync_playwright().start()
+    _shared.browser = _shared.playwright.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+    _shared.headless = headless
+    return _shared.browser
+
+
+def _shutdown_shared_chromium() -> None:
+    """Close this thread's shared Chromium and stop its Playwright driver."""
+    browser = getattr(_shared, "browser", None)
+    playwright = getattr(_shared, "playwright", None)
+    _shared.browser = _shared.playwright = None
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception as e:
+            logger.warning("Error closing Playwright browser: %s", e)
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception as e:
+            logger.warning("Error stopping Playwright: %s", e)
+
+
+# Safety net for scripts that exit without calling shutdown_shared(); it can
+# only reach the main thread's browser, worker threads still clean up their own.
+atexit.register(_shutdown_shared_chromium)
+
+
 class BaseScraper(ABC):
     """Base class for site-specific scrapers.
 
@@ -48,32 +128,35 @@ class BaseScraper(ABC):
         self._browser = None
         self._page = None
         self._context_manager = None  # Camoufox context or None
-        self._playwright = None       # Playwright instance or None
+        self._context = None          # Playwright BrowserContext or None
 
     def start_browser(self) -> None:
-        """Launch the browser (Playwright or Camoufox based on BROWSER_ENGINE)."""
-        if BROWSER_ENGINE == "camoufox":
+        """Launch the browser (Playwright or Camoufox based on BROWSER_ENGINE).
+
+        A no-op if this scraper's browser is already running, so retry paths
+        keep the existing context and page.
+        """
+        if self._page is not None:
+            return
+        if _CAMOUFOX is not None:
             self._start_camoufox()
         else:
             self._start_playwright()
 
     def _start_playwright(self) -> None:
-        """Launch Playwright Chromium browser."""
+        """Open a context on this thread's shared Playwright Chromium browser."""
         logger.info("Starting Playwright Chromium (headless=%s, proxy=%s)", self.headless, bool(self.proxy_server))
         headless = True if self.headless is True or self.headless == "virtual" else bool(self.headless)
+        self._browser = _shared_chromium(headless)
+        self._context = self._new_context()
+        self._page = self._context.new_page()
+        logger.info("Playwright browser started successfully")
+
+    def _new_context(self):
+        """Open a BrowserContext on the Chromium browser with this scraper's settings."""
         proxy = {"server": self.proxy_server} if self.proxy_server else None
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(
-            headless=headless,
-            proxy=proxy,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-            ],
-        )
         context = self._browser.new_context(
+            proxy=proxy,
             viewport={"width": 1920, "height": 1080},
             user_agent=(
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -84,21 +167,17 @@ class BaseScraper(ABC):
             # without this flag every HTTPS request through the proxy fails.
             ignore_https_errors=bool(self.proxy_server),
         )
-        self._page = context.new_page()
-        logger.info("Playwright browser started successfully")
+        context.route("**/*", _block_heavy_resources)
+        return context
 
     def _start_camoufox(self) -> None:
         """Launch Camoufox Firefox browser."""
-        Camoufox = _try_import_camoufox()
-        if Camoufox is None:
-            logger.warning("Camoufox unavailable, using Playwright instead")
-            self._start_playwright()
-            return
         logger.info("Starting Camoufox browser (headless=%s, proxy=%s)", self.headless, bool(self.proxy_server))
         proxy = {"server": self.proxy_server} if self.proxy_server else None
-        self._context_manager = Camoufox(headless=self.headless, proxy=proxy)
+        self._context_manager = _CAMOUFOX(headless=self.headless, proxy=proxy)
         self._browser = self._context_manager.__enter__()
         self._page = self._browser.new_page()
+        self._page.route("**/*", _block_heavy_resources)
         logger.info("Camoufox browser started successfully")
 
     def close_browser(self) -> None:
@@ -110,22 +189,23 @@ class BaseScraper(ABC):
                 logger.warning("Error closing Camoufox: %s", e)
             finally:
                 self._context_manager = None
-        if self._browser is not None and self._playwright is not None:
+        if self._context is not None:
+            # The shared browser stays up for the thread's next scraper
             try:
-                self._browser.close()
+                self._context.close()
             except Exception as e:
-                logger.warning("Error closing Playwright browser: %s", e)
-        if self._playwright is not None:
-            try:
-                self._playwright.stop()
-            except Exception as e:
-                logger.warning("Error stopping Playwright: %s", e)
+                logger.warning("Error closing Playwright context: %s", e)
             finally:
-                self._playwright = None
+                self._context = None
         self._browser = None
         self._page = None
         logger.info("Browser closed")
 
+    @staticmethod
+    def shutdown_shared() -> None:
+        """Close the calling thread's shared Chromium (call when done scraping)."""
+        _shutdown_shared_chromium()
+
     @property
     def page(self):
         """Get the current page, raising if browser not started."""
@@ -133,16 +213,35 @@ class BaseScraper(ABC):
             raise RuntimeError("Browser not started. Call start_browser() first.")
         return self._page
 
-    def navigate(self, url: str, wait_until: str = "domcontentloaded") -> None:
+    def navigate(self, url: str, wait_until: str = "domcontentloaded"):
         """Navigate to a URL with a random delay beforehand.
 
         Args:
             url: The URL to navigate to.
             wait_until: Playwright wait condition ("domcontentloaded", "load", "networkidle").
+
+        Returns:
+            The main-document Response (None for same-document navigations).
         """
         self.random_delay(1.5, 3.0)
         logger.info("Navigating to: %s", url)
-        self.page.goto(url, wait_until=wait_until, timeout=30000)
+        return self.page.goto(url, wait_until=wait_until, timeout=30000)
+
+    @staticmethod
+    def response_html(response) -> str | None:
+        """Server-sent HTML of a navigation response, or None if unusable.
+
+        Cheaper than get_page_content() (no DOM serialization), but holds
+        only what the server rendered, not what scripts added afterwards.
+        """
+        if response is None or not response.ok:
+            return None
+        if "text/html" not in (response.headers.get("content-type") or ""):
+            return None
+        try:
+            return response.text()
+        except Exception:
+            return None
 
     def get_page_content(self) -> str:
         """Return the current page's rendered HTML."""
@@ -150,13 +249,32 @@ class BaseScraper(ABC):
 
     def random_delay(self, min_s: float = 2.0, max_s: float = 5.0) -> None:
         """Wait a random duration to mimic human behavior."""
+        if SCRAPER_FAST:
+            return
         delay = random.uniform(min_s, max_s)
-        time.sleep(delay)
+        if self._page is not None:
+            # Sync Playwright only runs the route handler (and so lets routed
+            # requests finish) while this thread is inside a Playwright call;
+            # time.sleep would stall any in-flight page load for the delay.
+            self._page.wait_for_timeout(delay * 1000)
+        else:
+            time.sleep(delay)
 
     def scroll_page(self) -> None:
-        """Scroll down the page to trigger lazy-loaded content."""
-        self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1.5)
+        """Scroll down the page to trigger lazy-loaded content.
+
+        Returns as soon as the page grows (new content rendered), or after
+        1.5 s if nothing more loads.
+        """
+        height = self.page.evaluate(
+            "() => { window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight; }"
+        )
+        try:
+            self.page.wait_for_function(
+                "h => document.body.scrollHeight > h", arg=height, timeout=1500
+            )
+        except Exception:
+            pass  # nothing lazy-loaded within the window
 
     @abstractmethod
     def scrape_category(self, url: str, start_page: int = 0) -> Generator[dict, None, None]:
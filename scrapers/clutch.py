@@ -3,9 +3,10 @@
 import re
 import logging
 from typing import Generator
-from urllib.parse import urljoin, urlparse, parse_qs, unquote
+from urllib.parse import urljoin, unquote_plus
 
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 
 from scrapers.base import BaseScraper
 
@@ -30,6 +31,62 @@ SELECTORS = {
     "services": ".provider__services-list-item, .services-list li",
     "next_page": "a.sg-pagination-v2-next:not(.sg-pagination-v2-disabled), li.next a, a.page-link[rel='next'], .pager-next a",
 }
+# Fallback order matters, so each entry is tried one selector at a time;
+# split once here rather than on every card.
+SELECTORS = {key: tuple(value.split(", ")) for key, value in SELECTORS.items()}
+
+# The same selectors compiled to XPath once, instead of re-parsing the CSS
+# for every card
+COMPILED_SELECTORS = {
+    key: tuple(CSSSelector(selector) for selector in value)
+    for key, value in SELECTORS.items()
+}
+_HIGHLIGHT_ITEMS = CSSSelector(".list-item, .provider__highlights-item")
+_SERVICE_ITEMS = CSSSelector(".provider__services-list-item, .services-list li")
+
+# A clutch.co URL whose path contains /redirect, capturing its first u= value
+_REDIRECT_RE = re.compile(r"[^:/?#]+://[^/?#]*clutch\.co[^/?#]*[^?#]*/redirect[^?#]*\?(?:[^&#]*&)*?u=([^&#]+)")
+_TOTAL_RE = re.compile(r"([\d,]+)\s+(?:Companies|Providers|Results)", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"(\d+)")
+_EMP_RE = re.compile(r"\d+\s*[\-\+]\s*\d*")
+
+# Any of these marks a rendered listing (covers older layouts too)
+CARD_WAIT_SELECTOR = ", ".join([
+    "div.provider-row",
+    "li.provider-row",
+    "ul.providers__list > li",
+    "[data-provider]",
+    ".directory-list .provider",
+])
+
+# Run in the page with [card selectors, next-page selectors]; mirrors
+# _find_cards and _get_next_page_url so only card markup leaves the browser
+_EXTRACT_LISTING_JS = """
+([cardSelectors, nextSelectors]) => {
+    let cards = [];
+    for (const sel of cardSelectors) {
+        const els = document.querySelectorAll(sel);
+        if (els.length) {
+            cards = Array.from(els, el => el.outerHTML);
+            break;
+        }
+    }
+    let next = null;
+    for (const sel of nextSelectors) {
+        const el = document.querySelector(sel);
+        if (el && el.getAttribute("href")) {
+            next = el.getAttribute("href");
+            break;
+        }
+    }
+    return {cards, next};
+}
+"""
+
+
+def _text(element) -> str:
+    """Element text with runs of whitespace (indentation, newlines) collapsed."""
+    return " ".join(element.text_content().split())
 
 
 class ClutchScraper(BaseScraper):
@@ -40,7 +97,7 @@ class ClutchScraper(BaseScraper):
         try:
             html = self.get_page_content()
             # Clutch shows "X Companies" or "X Providers" in the header
-            match = re.search(r"([\d,]+)\s+(?:Companies|Providers|Results)", html, re.IGNORECASE)
+            match = _TOTAL_RE.search(html)
             if match:
                 return int(match.group(1).replace(",", ""))
         except Exception as e:
@@ -72,27 +129,11 @@ class ClutchScraper(BaseScraper):
             logger.info("Scraping page %d: %s", page_num, current_url)
             self.navigate(current_url, wait_until="domcontentloaded")
 
-            # Extra wait for JS-rendered content
-            self.page.wait_for_timeout(3000)
-
-            # Wait for company cards to render — try multiple selectors
-            card_found = False
-            for selector in [
-                "div.provider-row",
-                "li.provider-row",
-                "ul.providers__list > li",
-                "[data-provider]",
-                ".directory-list .provider",
-            ]:
-                try:
-                    self.page.wait_for_selector(selector, timeout=5000)
-                    card_found = True
-                    logger.info("Found cards with selector: %s", selector)
-                    break
-                except Exception:
-                    continue
-
-            if not card_found:
+            # Wait for company cards to render; the selector list matches any
+            # known card layout, so this returns as soon as the first appears
+            try:
+                self.page.wait_for_selector(CARD_WAIT_SELECTOR, state="attached", timeout=8000)
+            except Exception:
                 logger.warning("No company cards found on page %d, stopping.", page_num)
                 # Log page title for debugging
                 try:
@@ -105,11 +146,17 @@ class ClutchScraper(BaseScraper):
             # Scroll to load any lazy content
             self.scroll_page()
 
-            html = self.get_page_content()
-            soup = BeautifulSoup(html, "lxml")
+            # Pull just the card markup and next-page href out of the browser;
+            # the full page is only serialized if that finds no cards
+            card_htmls, next_href = self._extract_listing()
+            if card_htmls:
+                cards = [lxml_html.fragment_fromstring(h) for h in card_htmls]
+                next_url = urljoin(url, next_href) if next_href else None
+            else:
+                doc = lxml_html.document_fromstring(self.get_page_content())
+                cards = self._find_cards(doc)
+                next_url = self._get_next_page_url(doc, url)
 
-            # Find company cards using multiple possible selectors
-            cards = self._find_cards(soup)
             if not cards:
                 logger.warning("No company cards parsed on page %d, stopping.", page_num)
                 break
@@ -121,15 +168,30 @@ class ClutchScraper(BaseScraper):
                 if company and company.get("name"):
                     yield company
 
-            # Get next page URL
-            current_url = self._get_next_page_url(soup, url)
+            current_url = next_url
             page_num += 1
 
-    def _find_cards(self, soup: BeautifulSoup) -> list:
+    def _extract_listing(self) -> tuple[list[str], str | None]:
+        """Return (card outerHTMLs, next-page href) from the live page.
+
+        Applies the card and next-page selectors in the same fallback order
+        as _find_cards/_get_next_page_url. Returns ([], None) on failure.
+        """
+        try:
+            result = self.page.evaluate(
+                _EXTRACT_LISTING_JS,
+                [SELECTORS["company_card"], SELECTORS["next_page"]],
+            )
+            return result["cards"], result["next"]
+        except Exception as e:
+            logger.debug("In-page card extraction failed: %s", e)
+            return [], None
+
+    def _find_cards(self, doc) -> list:
         """Find company card elements using multiple selector strategies."""
         # Try each selector pattern
-        for selector in SELECTORS["company_card"].split(", "):
-            cards = soup.select(selector)
+        for selector in COMPILED_SELECTORS["company_card"]:
+            cards = selector(doc)
             if cards:
                 return cards
         return []
@@ -154,10 +216,10 @@ class ClutchScraper(BaseScraper):
             }
 
             # Company name and profile URL
-            name_el = self._select_first(card, SELECTORS["company_name"])
-            if name_el:
-                data["name"] = name_el.get_text(strip=True)
-                href = name_el.get("href", "")
+            name_el = self._select_first(card, "company_name")
+            if name_el is not None:
+                data["name"] = _text(name_el)
+                href = name_el.get("href") or ""
                 if href:
                     profile_url = urljoin("https://clutch.co", href)
                     # Sponsored listings wrap the name link in tracking URLs.
@@ -169,55 +231,52 @@ class ClutchScraper(BaseScraper):
                     data["profile_url"] = profile_url
 
             # Rating
-            rating_el = self._select_first(card, SELECTORS["rating"])
-            if rating_el:
-                data["rating"] = rating_el.get_text(strip=True)
+            rating_el = self._select_first(card, "rating")
+            if rating_el is not None:
+                data["rating"] = _text(rating_el)
 
             # Reviews count
-            reviews_el = self._select_first(card, SELECTORS["reviews_count"])
-            if reviews_el:
-                text = reviews_el.get_text(strip=True)
-                match = re.search(r"(\d+)", text)
+            reviews_el = self._select_first(card, "reviews_count")
+            if reviews_el is not None:
+                text = _text(reviews_el)
+                match = _DIGIT_RE.search(text)
                 if match:
                     data["reviews_count"] = match.group(1)
 
             # Location
-            loc_el = self._select_first(card, SELECTORS["location"])
-            if loc_el:
-                data["location"] = loc_el.get_text(strip=True)
+            loc_el = self._select_first(card, "location")
+            if loc_el is not None:
+                data["location"] = _text(loc_el)
 
             # Website URL
-            website_el = self._select_first(card, SELECTORS["website_link"])
-            if website_el:
-                href = website_el.get("href", "")
+            website_el = self._select_first(card, "website_link")
+            if website_el is not None:
+                href = website_el.get("href") or ""
                 if href and href.startswith("http"):
                     data["website_url"] = self._resolve_redirect_url(href)
 
             # Highlight items (min project, hourly rate, employees)
             # Clutch puts these in a highlights bar — try to extract from list items
-            highlights = card.select(".list-item, .provider__highlights-item")
-            for item in highlights:
-                text = item.get_text(strip=True).lower()
-                value = item.get_text(strip=True)
+            for item in _HIGHLIGHT_ITEMS(card):
+                value = _text(item)
+                text = value.lower()
                 if "$" in text and ("project" in text or "min" in text):
                     data["min_project"] = value
                 elif "$" in text and ("hr" in text or "/" in text):
                     data["hourly_rate"] = value
-                elif "employee" in text or re.search(r"\d+\s*[\-\+]\s*\d*", text):
+                elif "employee" in text or _EMP_RE.search(text):
                     if not data["employees"] and "$" not in text:
                         data["employees"] = value
 
             # Tagline
-            tagline_el = self._select_first(card, SELECTORS["tagline"])
-            if tagline_el:
-                data["tagline"] = tagline_el.get_text(strip=True)
+            tagline_el = self._select_first(card, "tagline")
+            if tagline_el is not None:
+                data["tagline"] = _text(tagline_el)
 
             # Services
-            service_els = card.select(
-                ".provider__services-list-item, .services-list li"
-            )
+            service_els = _SERVICE_ITEMS(card)
             if service_els:
-                services = [s.get_text(strip=True) for s in service_els]
+                services = [_text(s) for s in service_els]
                 data["services"] = ", ".join(services)
 
             return data
@@ -226,12 +285,12 @@ class ClutchScraper(BaseScraper):
             logger.warning("Error parsing company card: %s", e)
             return None
 
-    def _get_next_page_url(self, soup: BeautifulSoup, base_url: str) -> str | None:
+    def _get_next_page_url(self, doc, base_url: str) -> str | None:
         """Extract the next page URL from pagination."""
-        for selector in SELECTORS["next_page"].split(", "):
-            next_el = soup.select_one(selector)
-            if next_el:
-                href = next_el.get("href", "")
+        for selector in COMPILED_SELECTORS["next_page"]:
+            found = selector(doc)
+            if found:
+                href = found[0].get("href") or ""
                 if href:
                     return urljoin(base_url, href)
         return None
@@ -239,8 +298,8 @@ class ClutchScraper(BaseScraper):
     @staticmethod
     def _find_real_profile_link(card) -> str | None:
         """Scan all <a> tags in a card for the real /profile/... URL."""
-        for a_tag in card.find_all("a", href=True):
-            href = a_tag["href"]
+        for a_tag in card.iterfind(".//a[@href]"):
+            href = a_tag.get("href")
             if "/profile/" in href and "r.clutch.co" not in href and "ppc.clutch.co" not in href:
                 return urljoin("https://clutch.co", href)
         return None
@@ -253,27 +312,20 @@ class ClutchScraper(BaseScraper):
         Returns the decoded actual URL, or the original URL if not a redirect.
         Also handles ppc.clutch.co tracking links.
         """
-        try:
-            parsed = urlparse(url)
-            if "clutch.co" in parsed.netloc and "/redirect" in parsed.path:
-                params = parse_qs(parsed.query)
-                if "u" in params:
-                    resolved = unquote(params["u"][0])
-                    # The u= param may itself be a ppc.clutch.co link — skip those
-                    if "ppc.clutch.co" not in resolved:
-                        return resolved
-            # ppc.clutch.co links are tracking URLs with no real destination
-            if "ppc.clutch.co" in url:
-                return ""
-        except Exception:
-            pass
+        # ppc.clutch.co links (directly or as the u= target) are tracking
+        # URLs with no real destination
+        if "ppc.clutch.co" in url:
+            return ""
+        match = _REDIRECT_RE.match(url)
+        if match:
+            return unquote_plus(match.group(1))
         return url
 
     @staticmethod
-    def _select_first(element, selectors: str):
-        """Try multiple comma-separated CSS selectors, return first match."""
-        for selector in selectors.split(", "):
-            result = element.select_one(selector.strip())
-            if result:
-                return result
+    def _select_first(element, key: str):
+        """Try each compiled selector for SELECTORS[key] in order, return the first match."""
+        for selector in COMPILED_SELECTORS[key]:
+            found = selector(element)
+            if found:
+                return found[0]
         return None
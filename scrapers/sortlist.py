@@ -12,6 +12,13 @@ from scrapers.base import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# orjson parses the (often multi-MB) __NEXT_DATA__ blob several times faster
+# than the stdlib; its JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
 # Maximum pages to scrape per category (safety limit)
 MAX_PAGES = 50
 
@@ -72,7 +79,7 @@ class SortlistScraper(BaseScraper):
             # Clear intercepted data for this page
             self._intercepted_agencies = []
 
-            self.navigate(current_url, wait_until="domcontentloaded")
+            response = self.navigate(current_url, wait_until="domcontentloaded")
 
             # Wait for agency cards to render
             try:
@@ -86,7 +93,10 @@ class SortlistScraper(BaseScraper):
             self.random_delay(2.0, 4.0)
             self.scroll_page()
 
-            html = self.get_page_content()
+            # __NEXT_DATA__ is server-rendered, so the response body already
+            # has it; the live DOM is only serialized when that falls short
+            server_html = self.response_html(response)
+            html = server_html or self.get_page_content()
             companies_found = 0
 
             # Strategy 1: Parse __NEXT_DATA__ JSON (most reliable)
@@ -110,6 +120,8 @@ class SortlistScraper(BaseScraper):
             # Strategy 3: Parse HTML with semantic class selectors
             if companies_found == 0:
                 logger.info("Falling back to HTML card parsing on page %d", page_num)
+                if server_html is not None:
+                    html = self.get_page_content()
                 parsed = self._parse_html_cards(html, url)
                 for company in parsed:
                     if company.get("name"):
@@ -142,7 +154,7 @@ class SortlistScraper(BaseScraper):
             return []
 
         try:
-            data = json.loads(script.string)
+            data = _json.loads(str(script.string))
         except (json.JSONDecodeError, TypeError):
             logger.debug("Failed to parse __NEXT_DATA__ JSON")
             return []
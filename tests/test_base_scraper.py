@@ -1,7 +1,8 @@
 """Tests for scrapers.base module."""
 
 import pytest
-from scrapers.base import BaseScraper
+from unittest.mock import MagicMock, patch
+from scrapers.base import BaseScraper, _block_heavy_resources
 from scrapers.clutch import ClutchScraper
 from scrapers.sortlist import SortlistScraper
 
@@ -69,6 +70,110 @@ class TestCloseBrowser:
         assert s._context_manager is None
 
 
+class TestSharedBrowser:
+    def test_close_closes_only_own_context(self):
+        s = ConcreteScraper()
+        browser, context = MagicMock(), MagicMock()
+        s._browser, s._context, s._page = browser, context, MagicMock()
+        s.close_browser()
+        context.close.assert_called_once()
+        browser.close.assert_not_called()
+        assert s._context is None
+
+    def test_shutdown_without_browser_is_safe(self):
+        BaseScraper.shutdown_shared()  # Should not raise
+
+    @patch("scrapers.base._shared_chromium")
+    def test_restart_reuses_context(self, mock_chromium):
+        s = ConcreteScraper()
+        s.start_browser()
+        s.start_browser()
+        mock_chromium.return_value.new_context.assert_called_once()
+
+
+class TestRandomDelay:
+    @patch("scrapers.base.SCRAPER_FAST", False)
+    @patch("scrapers.base.time.sleep")
+    def test_waits_through_playwright_when_page_open(self, mock_sleep):
+        s = ConcreteScraper()
+        s._page = MagicMock()
+        s.random_delay(1.0, 1.0)
+        s._page.wait_for_timeout.assert_called_once_with(1000.0)
+        mock_sleep.assert_not_called()
+
+    @patch("scrapers.base.SCRAPER_FAST", False)
+    @patch("scrapers.base.time.sleep")
+    def test_sleeps_without_page(self, mock_sleep):
+        ConcreteScraper().random_delay(1.0, 1.0)
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class TestScrollPage:
+    def test_waits_for_page_growth(self):
+        s = ConcreteScraper()
+        s._page = MagicMock()
+        s._page.evaluate.return_value = 1000
+        s.scroll_page()
+        args, kwargs = s._page.wait_for_function.call_args
+        assert kwargs["arg"] == 1000
+        assert kwargs["timeout"] == 1500
+
+    def test_no_growth_timeout_is_swallowed(self):
+        s = ConcreteScraper()
+        s._page = MagicMock()
+        s._page.wait_for_function.side_effect = Exception("Timeout 1500ms exceeded")
+        s.scroll_page()  # Should not raise
+
+
+class TestResponseHtml:
+    def _response(self, ok=True, content_type="text/html; charset=utf-8"):
+        response = MagicMock()
+        response.ok = ok
+        response.headers = {"content-type": content_type}
+        response.text.return_value = "<html></html>"
+        return response
+
+    def test_html_response_body_returned(self):
+        assert BaseScraper.response_html(self._response()) == "<html></html>"
+
+    def test_no_response(self):
+        assert BaseScraper.response_html(None) is None
+
+    def test_error_status(self):
+        assert BaseScraper.response_html(self._response(ok=False)) is None
+
+    def test_non_html_body(self):
+        assert BaseScraper.response_html(self._response(content_type="application/json")) is None
+
+
+class TestResourceBlocking:
+    @pytest.mark.parametrize("resource_type", ["image", "media", "font"])
+    def test_heavy_resources_aborted(self, resource_type):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.request.url = "https://clutch.co/static/asset"
+        _block_heavy_resources(route)
+        route.abort.assert_called_once()
+        route.continue_.assert_not_called()
+
+    def test_tracker_script_aborted(self):
+        route = MagicMock()
+        route.request.resource_type = "script"
+        route.request.url = "https://www.google-analytics.com/analytics.js"
+        _block_heavy_resources(route)
+        route.abort.assert_called_once()
+        route.continue_.assert_not_called()
+
+    @pytest.mark.parametrize("resource_type", ["document", "script", "xhr", "stylesheet"])
+    def test_other_resources_continue(self, resource_type):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.request.url = "https://clutch.co/developers"
+        _block_heavy_resources(route)
+        route.continue_.assert_called_once()
+        route.abort.assert_not_called()
+
+
 class TestConcreteSubclasses:
     """Verify both concrete scrapers can be instantiated."""
 
@@ -63,6 +63,11 @@ class TestGetCategories:
         with pytest.raises(KeyError):
             get_categories("Unknown.com")
 
+    def test_result_is_cached_and_immutable(self):
+        cats = get_categories("Clutch.co")
+        assert isinstance(cats, tuple)
+        assert get_categories("Clutch.co") is cats
+
 
 class TestGetCategoryUrl:
     # Clutch URLs
@@ -3,8 +3,10 @@
 Uses synthetic HTML fixtures — no live network calls required.
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from scrapers.clutch import ClutchScraper, SELECTORS, MAX_PAGES
 
 
@@ -104,6 +106,14 @@ class TestResolveRedirectUrl:
         result = ClutchScraper._resolve_redirect_url(redirect)
         assert result == "https://company.com/page?q=1&lang=en"
 
+    def test_first_u_param_wins(self):
+        redirect = "https://r.clutch.co/redirect?you=x&u=https%3A%2F%2Fa.com&u=https%3A%2F%2Fb.com"
+        assert ClutchScraper._resolve_redirect_url(redirect) == "https://a.com"
+
+    def test_ppc_target_dropped(self):
+        redirect = "https://r.clutch.co/redirect?u=https%3A%2F%2Fppc.clutch.co%2Fclick"
+        assert ClutchScraper._resolve_redirect_url(redirect) == ""
+
     def test_empty_string(self):
         assert ClutchScraper._resolve_redirect_url("") == ""
 
@@ -115,21 +125,18 @@ class TestResolveRedirectUrl:
 
 class TestSelectFirst:
     def test_finds_first_matching_selector(self):
-        html = '<div><span class="a">first</span><span class="b">second</span></div>'
-        soup = BeautifulSoup(html, "lxml")
-        result = ClutchScraper._select_first(soup, "span.a, span.b")
-        assert result.get_text() == "first"
+        html = '<div><span class="sg-rating__number">4.9</span><span class="rating">3.0</span></div>'
+        result = ClutchScraper._select_first(lxml_html.fromstring(html), "rating")
+        assert result.text_content() == "4.9"
 
     def test_fallback_to_second_selector(self):
-        html = '<div><span class="b">only-b</span></div>'
-        soup = BeautifulSoup(html, "lxml")
-        result = ClutchScraper._select_first(soup, "span.a, span.b")
-        assert result.get_text() == "only-b"
+        html = '<div><span class="rating">3.0</span></div>'
+        result = ClutchScraper._select_first(lxml_html.fromstring(html), "rating")
+        assert result.text_content() == "3.0"
 
     def test_returns_none_when_no_match(self):
         html = '<div><span class="c">none</span></div>'
-        soup = BeautifulSoup(html, "lxml")
-        result = ClutchScraper._select_first(soup, "span.a, span.b")
+        result = ClutchScraper._select_first(lxml_html.fromstring(html), "rating")
         assert result is None
 
 
@@ -138,20 +145,17 @@ class TestSelectFirst:
 class TestFindCards:
     def test_finds_provider_row_divs(self, scraper):
         html = '<div class="provider-row">A</div><div class="provider-row">B</div>'
-        soup = BeautifulSoup(html, "lxml")
-        cards = scraper._find_cards(soup)
+        cards = scraper._find_cards(lxml_html.document_fromstring(html))
         assert len(cards) == 2
 
     def test_finds_li_provider_row(self, scraper):
         html = '<li class="provider-row">A</li>'
-        soup = BeautifulSoup(html, "lxml")
-        cards = scraper._find_cards(soup)
+        cards = scraper._find_cards(lxml_html.document_fromstring(html))
         assert len(cards) == 1
 
     def test_empty_page_returns_empty(self, scraper):
         html = '<div class="no-companies">Nothing here</div>'
-        soup = BeautifulSoup(html, "lxml")
-        cards = scraper._find_cards(soup)
+        cards = scraper._find_cards(lxml_html.document_fromstring(html))
         assert cards == []
 
 
@@ -160,8 +164,7 @@ class TestFindCards:
 class TestParseCompanyCard:
     def test_extracts_all_fields(self, scraper):
         card_html = make_card_html()
-        soup = BeautifulSoup(card_html, "lxml")
-        card = soup.select_one("div.provider-row")
+        card = lxml_html.fromstring(card_html)
         result = scraper._parse_company_card(card, "https://clutch.co/developers")
 
         assert result["name"] == "Test Company"
@@ -180,15 +183,13 @@ class TestParseCompanyCard:
         card_html = make_card_html(
             website_href="https://r.clutch.co/redirect?u=https%3A%2F%2Factual.com"
         )
-        soup = BeautifulSoup(card_html, "lxml")
-        card = soup.select_one("div.provider-row")
+        card = lxml_html.fromstring(card_html)
         result = scraper._parse_company_card(card, "https://clutch.co/developers")
         assert result["website_url"] == "https://actual.com"
 
     def test_missing_website(self, scraper):
         card_html = make_card_html(website_href="")
-        soup = BeautifulSoup(card_html, "lxml")
-        card = soup.select_one("div.provider-row")
+        card = lxml_html.fromstring(card_html)
         result = scraper._parse_company_card(card, "https://clutch.co/developers")
         assert result["website_url"] == ""
 
@@ -198,16 +199,23 @@ class TestParseCompanyCard:
             <h3 class="provider__title"><a class="provider__title-link" href="/p/x">NoRating Co</a></h3>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        card = soup.select_one("div.provider-row")
+        card = lxml_html.fromstring(html)
         result = scraper._parse_company_card(card, "https://clutch.co/developers")
         assert result["name"] == "NoRating Co"
         assert result["rating"] == ""
 
+    def test_multiline_text_collapsed(self, scraper):
+        card_html = make_card_html(
+            name="\n      Acme\n      Digital  ", tagline="Apps\n   that ship"
+        )
+        card = lxml_html.fromstring(card_html)
+        result = scraper._parse_company_card(card, "https://clutch.co/developers")
+        assert result["name"] == "Acme Digital"
+        assert result["tagline"] == "Apps that ship"
+
     def test_reviews_extracts_number_only(self, scraper):
         card_html = make_card_html(reviews="156 Reviews on Clutch")
-        soup = BeautifulSoup(card_html, "lxml")
-        card = soup.select_one("div.provider-row")
+        card = lxml_html.fromstring(card_html)
         result = scraper._parse_company_card(card, "https://clutch.co/developers")
         assert result["reviews_count"] == "156"
 
@@ -217,29 +225,81 @@ class TestParseCompanyCard:
 class TestGetNextPageUrl:
     def test_finds_next_page(self, scraper):
         html = '<ul><li class="next"><a href="/developers?page=2">Next</a></li></ul>'
-        soup = BeautifulSoup(html, "lxml")
-        result = scraper._get_next_page_url(soup, "https://clutch.co/developers")
+        doc = lxml_html.document_fromstring(html)
+        result = scraper._get_next_page_url(doc, "https://clutch.co/developers")
         assert result == "https://clutch.co/developers?page=2"
 
     def test_no_next_page_returns_none(self, scraper):
         html = '<ul><li class="prev"><a href="/developers?page=1">Prev</a></li></ul>'
-        soup = BeautifulSoup(html, "lxml")
-        result = scraper._get_next_page_url(soup, "https://clutch.co/developers")
+        doc = lxml_html.document_fromstring(html)
+        result = scraper._get_next_page_url(doc, "https://clutch.co/developers")
         assert result is None
 
     def test_relative_href_resolved(self, scraper):
         html = '<ul><li class="next"><a href="?page=3">Next</a></li></ul>'
-        soup = BeautifulSoup(html, "lxml")
-        result = scraper._get_next_page_url(soup, "https://clutch.co/developers")
+        doc = lxml_html.document_fromstring(html)
+        result = scraper._get_next_page_url(doc, "https://clutch.co/developers")
         assert "page=3" in result
 
     def test_empty_href_returns_none(self, scraper):
         html = '<ul><li class="next"><a href="">Next</a></li></ul>'
-        soup = BeautifulSoup(html, "lxml")
-        result = scraper._get_next_page_url(soup, "https://clutch.co/developers")
+        doc = lxml_html.document_fromstring(html)
+        result = scraper._get_next_page_url(doc, "https://clutch.co/developers")
         assert result is None
 
 
+# ── scrape_category ─────────────────────────────────────────────────────
+
+class TestScrapeCategory:
+    @pytest.fixture
+    def live_scraper(self, scraper):
+        scraper._page = MagicMock()
+        with patch.object(scraper, "random_delay"), patch.object(scraper, "scroll_page"):
+            yield scraper
+
+    def test_waits_for_cards_not_fixed_timeout(self, live_scraper):
+        live_scraper._page.evaluate.return_value = {"cards": [], "next": None}
+        live_scraper._page.content.return_value = make_page_html(make_card_html())
+        companies = list(live_scraper.scrape_category("https://clutch.co/developers"))
+        assert [c["name"] for c in companies] == ["Test Company"]
+        live_scraper._page.wait_for_timeout.assert_not_called()
+        live_scraper._page.wait_for_selector.assert_called_once()
+
+    def test_parses_in_page_card_markup(self, live_scraper):
+        live_scraper._page.evaluate.side_effect = [
+            {"cards": [make_card_html(name="A").strip(), make_card_html(name="B").strip()],
+             "next": "?page=1"},
+            {"cards": [make_card_html(name="C").strip()], "next": None},
+        ]
+        companies = list(live_scraper.scrape_category("https://clutch.co/developers"))
+        assert [c["name"] for c in companies] == ["A", "B", "C"]
+        live_scraper._page.content.assert_not_called()
+
+    def test_consumer_navigating_page_between_yields(self, live_scraper):
+        # app.py hands scraper.page to EmailExtractor, which visits company
+        # sites between yields; the next listing page must still be loaded
+        live_scraper._page.evaluate.side_effect = [
+            {"cards": [make_card_html(name="A").strip()], "next": "?page=1"},
+            {"cards": [make_card_html(name="B").strip()], "next": None},
+        ]
+        companies = live_scraper.scrape_category("https://clutch.co/developers")
+        assert next(companies)["name"] == "A"
+        live_scraper._page.goto("https://testcompany.com/contact")
+
+        assert next(companies)["name"] == "B"
+        visited = [c.args[0] for c in live_scraper._page.goto.call_args_list]
+        assert visited == [
+            "https://clutch.co/developers",
+            "https://testcompany.com/contact",
+            "https://clutch.co/developers?page=1",
+        ]
+
+    def test_stops_when_no_cards_render(self, live_scraper):
+        live_scraper._page.wait_for_selector.side_effect = Exception("Timeout 8000ms exceeded")
+        assert list(live_scraper.scrape_category("https://clutch.co/developers")) == []
+        live_scraper._page.content.assert_not_called()
+
+
 # ── Constants ───────────────────────────────────────────────────────────
 
 class TestConstants:
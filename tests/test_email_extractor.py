@@ -9,7 +9,11 @@ from bs4 import BeautifulSoup
 from extractors.email_extractor import (
     EmailExtractor,
     CONTACT_PAGE_PATTERNS,
+    CONTACT_PAGE_RE,
     CONTACT_LINK_TEXT,
+    fetch_static_email,
+    may_contain_email,
+    prefetch_emails,
 )
 
 
@@ -67,6 +71,29 @@ class TestExtractBestEmail:
         # The regex runs on full HTML source too
         assert extractor._extract_best_email(html) == "hidden@company.com"
 
+    @pytest.mark.parametrize("entity", [
+        "&#64;", "&#064;", "&#x40;", "&#X40;", "&#x0040;", "&#64", "&commat;",
+    ])
+    def test_entity_encoded_at_sign(self, extractor, entity):
+        html = f"<html><body><p>Write to info{entity}company.com</p></body></html>"
+        assert extractor._extract_best_email(html) == "info@company.com"
+
+    @pytest.mark.parametrize("entity", [
+        "&#064;", "&#x0040;", "&#64", "&#x40", "&COMMAT;",
+    ])
+    def test_entity_variants_pass_prefilter(self, entity):
+        assert may_contain_email(f"info{entity}company.com")
+
+    @patch("extractors.email_extractor.parse_html")
+    def test_page_without_at_sign_skips_parsing(self, mock_parse, extractor):
+        html = "<html><body><p>No email here at all.</p></body></html>"
+        assert extractor._extract_best_email(html) is None
+        mock_parse.assert_not_called()
+
+    def test_xhtml_with_encoding_declaration(self, extractor):
+        html = '<?xml version="1.0" encoding="UTF-8"?><html><body><a href="mailto:info@company.com">Mail</a></body></html>'
+        assert extractor._extract_best_email(html) == "info@company.com"
+
     def test_multiple_emails_returns_best(self, extractor):
         html = """
         <body>
@@ -157,6 +184,12 @@ class TestFindContactPageUrls:
 # ── find_email ──────────────────────────────────────────────────────────
 
 class TestFindEmail:
+    @pytest.fixture(autouse=True)
+    def no_static_fetch(self):
+        """Keep these tests on the browser path; no network access."""
+        with patch("extractors.email_extractor.fetch_static_email", return_value=None) as mock_fetch:
+            yield mock_fetch
+
     def test_invalid_url_returns_unreachable(self, extractor):
         assert extractor.find_email("") == "Unreachable"
         assert extractor.find_email("not-a-url") == "Unreachable"
@@ -201,6 +234,90 @@ class TestFindEmail:
     def test_ftp_url_returns_unreachable(self, extractor):
         assert extractor.find_email("ftp://files.company.com") == "Unreachable"
 
+    def test_static_hit_skips_browser(self, extractor, mock_page, no_static_fetch):
+        no_static_fetch.return_value = "info@acme-corp.com"
+        assert extractor.find_email("https://acme-corp.com") == "info@acme-corp.com"
+        mock_page.goto.assert_not_called()
+
+    def test_http_first_false_goes_straight_to_browser(self, extractor, mock_page, no_static_fetch):
+        mock_page.content.return_value = '<a href="mailto:info@acme-corp.com">Email</a>'
+        assert extractor.find_email("https://acme-corp.com", http_first=False) == "info@acme-corp.com"
+        no_static_fetch.assert_not_called()
+
+    def test_same_site_reuses_result(self, extractor, mock_page):
+        mock_page.content.return_value = '<a href="mailto:info@acme-corp.com">Email</a>'
+        assert extractor.find_email("https://acme-corp.com") == "info@acme-corp.com"
+        assert extractor.find_email("https://www.ACME-corp.com/?utm_source=clutch") == "info@acme-corp.com"
+        mock_page.goto.assert_called_once()
+
+    def test_shared_host_tenants_not_reused(self, extractor, mock_page):
+        mock_page.content.side_effect = [
+            '<a href="mailto:hello@first-agency.com">Email</a>',
+            '<a href="mailto:hello@second-agency.com">Email</a>',
+        ]
+        assert extractor.find_email("https://www.facebook.com/firstagency") == "hello@first-agency.com"
+        assert extractor.find_email("https://www.facebook.com/secondagency") == "hello@second-agency.com"
+
+    def test_unreachable_not_cached(self, extractor, mock_page):
+        mock_page.goto.side_effect = [Exception("Timeout"), None]
+        mock_page.content.return_value = '<a href="mailto:info@acme-corp.com">Email</a>'
+        assert extractor.find_email("https://acme-corp.com") == "Unreachable"
+        assert extractor.find_email("https://acme-corp.com") == "info@acme-corp.com"
+
+
+# ── Static prefetch ─────────────────────────────────────────────────────
+
+def _mock_response(body: str, content_type: str = "text/html; charset=utf-8"):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers.get.return_value = content_type
+    response.headers.get_content_charset.return_value = "utf-8"
+    response.read.return_value = body.encode()
+    return response
+
+
+class TestStaticPrefetch:
+    @patch("extractors.email_extractor.urlopen")
+    def test_email_found_in_static_html(self, mock_urlopen):
+        mock_urlopen.return_value = _mock_response('<a href="mailto:info@acme-corp.com">Mail</a>')
+        assert fetch_static_email("https://acme-corp.com") == "info@acme-corp.com"
+
+    @patch("extractors.email_extractor.urlopen")
+    def test_non_html_response_skipped(self, mock_urlopen):
+        mock_urlopen.return_value = _mock_response("info@acme-corp.com", "application/pdf")
+        assert fetch_static_email("https://acme-corp.com") is None
+
+    @patch("extractors.email_extractor.urlopen")
+    def test_falls_back_to_static_contact_page(self, mock_urlopen):
+        mock_urlopen.side_effect = [
+            _mock_response('<a href="/contact">Contact</a>'),
+            _mock_response('<p>Write to hello@acme-corp.com</p>'),
+        ]
+        assert fetch_static_email("https://acme-corp.com") == "hello@acme-corp.com"
+        assert mock_urlopen.call_count == 2
+
+    @patch("extractors.email_extractor.urlopen", side_effect=OSError("refused"))
+    def test_network_error_returns_none(self, mock_urlopen):
+        assert fetch_static_email("https://down.com") is None
+
+    def test_invalid_url_not_fetched(self):
+        assert fetch_static_email("") is None
+        assert fetch_static_email("ftp://files.company.com") is None
+
+    @patch("extractors.email_extractor.fetch_static_email")
+    def test_prefetch_maps_distinct_urls(self, mock_fetch):
+        mock_fetch.side_effect = lambda u: "info@a.com" if "a.com" in u else None
+        result = prefetch_emails(["https://a.com", "", "https://b.com", "https://a.com"])
+        assert result == {"https://a.com": "info@a.com", "https://b.com": None}
+        assert mock_fetch.call_count == 2
+
+    @patch("v2.extractors.email_extractor.fetch_html", return_value=None)
+    def test_v2_static_pass_stops_after_landing_failure(self, mock_fetch):
+        from v2.extractors.email_extractor import EmailExtractor as V2Extractor, STATIC_PASS_TIMEOUT
+
+        assert V2Extractor(MagicMock())._fetch_static("https://down.com") is None
+        mock_fetch.assert_called_once_with("https://down.com", timeout=STATIC_PASS_TIMEOUT)
+
 
 # ── Contact page patterns ───────────────────────────────────────────────
 
@@ -223,6 +340,13 @@ class TestContactPagePatterns:
         matched = any(p.search(path) for p in CONTACT_PAGE_PATTERNS)
         assert not matched, f"Pattern should NOT match: {path}"
 
+    @pytest.mark.parametrize("path", [
+        "/contact", "/About-Us", "/equipe", "/legal/terms", "/products", "/blog",
+    ])
+    def test_merged_pattern_agrees_with_list(self, path):
+        expected = any(p.search(path) for p in CONTACT_PAGE_PATTERNS)
+        assert bool(CONTACT_PAGE_RE.search(path)) == expected
+
 
 class TestContactLinkText:
     @pytest.mark.parametrize("text", [
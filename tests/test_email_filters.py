@@ -122,6 +122,10 @@ class TestIsValidEmail:
         # But "alert" as exact match IS blocked
         assert is_valid_email("alert@company.com") is False
 
+    def test_blocked_prefix_longer_word_accepted(self):
+        assert is_valid_email("alerts@company.com") is True
+        assert is_valid_email("bouncer@company.com") is True
+
 
 # ── is_preferred_email ──────────────────────────────────────────────────
 
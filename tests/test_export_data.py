@@ -0,0 +1,40 @@
+"""Tests for v2.export_data loading (temporary SQLite database, no email)."""
+
+import pytest
+
+from v2.db.database import Database
+from v2.export_data import load_data_by_service
+
+# Header of the files the exporter has always written
+BASELINE_HEADER = [
+    "name", "profile_url", "rating", "reviews_count", "location", "country",
+    "website_url", "min_project", "hourly_rate", "employees", "team_size",
+    "tagline", "services", "source", "email", "contact_form_url",
+    "category", "sub_category",
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "companies.db")
+    database.connect()
+    database.save_companies([
+        {"name": "Mail Co", "profile_url": "https://clutch.co/profile/mail",
+         "email": "info@mail.co", "rating": "4.8"},
+        {"name": "Form Co", "profile_url": "https://clutch.co/profile/form",
+         "contact_form_url": "https://form.co/contact", "rating": "4.1"},
+    ], "Development", "Web", "Clutch.co")
+    yield database
+    database.close()
+
+
+class TestLoadDataByService:
+    def test_column_order_matches_baseline_exports(self, db):
+        df_emails, df_forms = load_data_by_service(db)["Development"]
+        assert list(df_emails.columns) == BASELINE_HEADER
+        assert list(df_forms.columns) == BASELINE_HEADER
+
+    def test_splits_emails_from_contact_forms(self, db):
+        df_emails, df_forms = load_data_by_service(db)["Development"]
+        assert df_emails["name"].tolist() == ["Mail Co"]
+        assert df_forms["name"].tolist() == ["Form Co"]
@@ -0,0 +1,69 @@
+"""Tests for v2.scrape_all batch persistence.
+
+Uses a temporary SQLite database and a fake scraper — no browser required.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from v2 import scrape_all
+from v2.db.database import Database
+
+
+def make_company(name, slug):
+    return {"name": name, "profile_url": f"https://clutch.co/profile/{slug}"}
+
+
+# A dict value can't be bound as an SQLite parameter, so this row fails to save
+BAD_COMPANY = {"name": {"not": "a string"}, "profile_url": "https://clutch.co/profile/bad"}
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "companies.db")
+    database.connect()
+    yield database
+    database.close()
+
+
+def company_names(db):
+    return {r["name"] for r in db.conn.execute("SELECT name FROM companies")}
+
+
+class TestSaveScrapedRows:
+    def test_bad_row_does_not_discard_good_rows(self, db):
+        rows = [make_company("Good A", "a"), BAD_COMPANY, make_company("Good B", "b")]
+        scrape_all._save_scraped_rows(db, rows, "Development", "Web", "Clutch.co")
+        assert company_names(db) == {"Good A", "Good B"}
+
+    def test_never_raises_when_every_save_fails(self):
+        db = MagicMock()
+        db.save_companies.side_effect = Exception("database is locked")
+        scrape_all._save_scraped_rows(db, [make_company("A", "a")], "Development", "Web", "Clutch.co")
+
+
+class TestScrapeBatchFailure:
+    def test_failing_row_marks_task_failed_and_continues(self, db):
+        tasks = [
+            ("Development", "Web", "https://clutch.co/web-developers"),
+            ("Development", "Mobile", "https://clutch.co/app-developers"),
+        ]
+        rows_by_url = {
+            tasks[0][2]: [make_company("Good A", "a"), BAD_COMPANY],
+            tasks[1][2]: [make_company("Good B", "b")],
+        }
+
+        def make_scraper(source, proxy):
+            scraper = MagicMock()
+            scraper.scrape_category.side_effect = lambda url, start_page: iter(rows_by_url[url])
+            return scraper
+
+        with patch.object(scrape_all, "get_all_scrape_tasks", return_value=tasks), \
+             patch.object(scrape_all, "_create_scraper", side_effect=make_scraper), \
+             patch.object(scrape_all.time, "sleep"):
+            assert scrape_all._scrape_batch(db, "Clutch.co", max_pages=1, proxy="") is True
+
+        status = {p["field"]: p["status"] for p in db.get_scrape_progress()}
+        assert status == {"Web": "failed", "Mobile": "batch_done"}
+        assert company_names(db) == {"Good A", "Good B"}
@@ -4,6 +4,8 @@ Uses synthetic HTML/__NEXT_DATA__ fixtures — no live network calls required.
 """
 
 import json
+from unittest.mock import MagicMock, patch
+
 import pytest
 from bs4 import BeautifulSoup
 from scrapers.sortlist import SortlistScraper, MAX_PAGES
@@ -410,6 +412,34 @@ class TestBuildPageUrl:
         assert "page=2" in result
 
 
+# ── scrape_category ─────────────────────────────────────────────────────
+
+class TestScrapeCategory:
+    @pytest.fixture
+    def live_scraper(self, scraper):
+        scraper._page = MagicMock()
+        with patch.object(scraper, "random_delay"), patch.object(scraper, "scroll_page"):
+            yield scraper
+
+    def test_next_data_read_from_navigation_response(self, live_scraper):
+        response = live_scraper._page.goto.return_value
+        response.ok = True
+        response.headers = {"content-type": "text/html; charset=utf-8"}
+        response.text.return_value = make_next_data_html([make_agency_jsonapi()])
+
+        company = next(live_scraper.scrape_category("https://www.sortlist.com/advertising"))
+        assert company["name"] == "Test Agency"
+        live_scraper._page.content.assert_not_called()
+
+    def test_rendered_dom_used_without_html_response(self, live_scraper):
+        live_scraper._page.goto.return_value = None
+        live_scraper._page.content.return_value = make_next_data_html([make_agency_jsonapi()])
+
+        company = next(live_scraper.scrape_category("https://www.sortlist.com/advertising"))
+        assert company["name"] == "Test Agency"
+        live_scraper._page.content.assert_called_once()
+
+
 # ── Constants ───────────────────────────────────────────────────────────
 
 class TestSortlistConstants:
@@ -76,6 +76,12 @@ CREATE TABLE IF NOT EXISTS scrape_progress (
 );
 """
 
+# Scraped fields that overwrite an existing company row when non-empty
+_UPDATABLE_FIELDS = (
+    "name", "rating", "reviews_count", "location", "website_url",
+    "min_project", "hourly_rate", "employees", "team_size", "tagline", "services",
+)
+
 
 def _extract_country(location: str) -> str:
     """Extract country from location string.
@@ -100,15 +106,35 @@ def _extract_country(location: str) -> str:
 class Database:
     """SQLite database wrapper for company data."""
 
-    def __init__(self, db_path: str | Path | None = None):
+    def __init__(self, db_path: str | Path | None = None, read_only: bool = False):
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.read_only = read_only
         self._conn: sqlite3.Connection | None = None
 
     def connect(self) -> None:
+        # Read-only mode opens the file with mode=ro and skips the schema
+        # script; a missing file still gets created read/write first.
+        if self.read_only and self.db_path.exists():
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA query_only=ON")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-65536")
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            logger.info("Database connected (read-only): %s", self.db_path)
+            return
+
         self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL is crash-safe with NORMAL sync; keep temp tables and a 64 MB
+        # page cache in memory and mmap up to 256 MB of the file.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.execute("PRAGMA mmap_size=268435456")
         self._conn.execute("PRAGMA foreign_keys=ON")
         self._conn.executescript(SCHEMA_SQL)
         self._conn.commit()
@@ -132,6 +158,33 @@ class Database:
 
         Uses profile_url as the dedup key.
         """
+        company_id = self._upsert_company_row(data)
+        self.conn.commit()
+        return company_id
+
+    def save_companies(self, companies: list[dict], service: str, field: str, source: str) -> None:
+        """Upsert a batch of companies and link them to a category.
+
+        The whole batch is written in one IMMEDIATE transaction, with a
+        single executemany for the category links, so SQLite syncs once
+        per batch instead of twice per company.
+        """
+        if not companies:
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            company_ids = [self._upsert_company_row(data) for data in companies]
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO company_categories (company_id, service, field, source) VALUES (?, ?, ?, ?)",
+                [(company_id, service, field, source) for company_id in company_ids],
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _upsert_company_row(self, data: dict) -> int:
+        """Insert or update a company without committing."""
         profile_url = data.get("profile_url", "")
         if not profile_url:
             return self._insert_company(data)
@@ -175,21 +228,13 @@ class Database:
                 data.get("contact_form_url", ""),
             ),
         )
-        self.conn.commit()
         return cursor.lastrowid
 
     def _update_company_fields(self, company_id: int, data: dict) -> None:
         updates = []
         params = []
-        field_map = {
-            "name": "name", "rating": "rating", "reviews_count": "reviews_count",
-            "location": "location", "website_url": "website_url",
-            "min_project": "min_project", "hourly_rate": "hourly_rate",
-            "employees": "employees", "team_size": "team_size",
-            "tagline": "tagline", "services": "services",
-        }
-        for data_key, col in field_map.items():
-            value = data.get(data_key, "")
+        for col in _UPDATABLE_FIELDS:
+            value = data.get(col)
             if value:
                 if col == "rating":
                     value = self._parse_float(value)
@@ -206,7 +251,6 @@ class Database:
             self.conn.execute(
                 f"UPDATE companies SET {', '.join(updates)} WHERE id = ?", params
             )
-            self.conn.commit()
 
     def add_category(self, company_id: int, service: str, field: str, source: str) -> None:
         self.conn.execute(
@@ -228,7 +272,7 @@ class Database:
                WHERE website_url IS NOT NULL AND website_url != ''
                AND (email IS NULL OR email = '')
                ORDER BY id"""
-        ).fetchall()
+        )
         return [dict(r) for r in rows]
 
     # ── Scrape progress ──────────────────────────────────────────────
@@ -247,21 +291,21 @@ class Database:
         """Return tasks not yet fully completed (pending, failed, or paused between batches)."""
         rows = self.conn.execute(
             "SELECT source, service, field, url, pages_scraped FROM scrape_progress WHERE status IN ('pending', 'failed') ORDER BY id"
-        ).fetchall()
+        )
         return [dict(r) for r in rows]
 
     def get_batch_tasks(self) -> list[dict]:
         """Return tasks that need another batch (batch_done status)."""
         rows = self.conn.execute(
             "SELECT source, service, field, url, pages_scraped FROM scrape_progress WHERE status = 'batch_done' ORDER BY id"
-        ).fetchall()
+        )
         return [dict(r) for r in rows]
 
     def get_resumable_tasks(self) -> list[dict]:
         """Return all tasks that aren't fully completed (pending + failed + batch_done)."""
         rows = self.conn.execute(
             "SELECT source, service, field, url, pages_scraped FROM scrape_progress WHERE status IN ('pending', 'failed', 'batch_done') ORDER BY id"
-        ).fetchall()
+        )
         return [dict(r) for r in rows]
 
     def mark_task_in_progress(self, source: str, service: str, field: str) -> None:
@@ -301,7 +345,7 @@ class Database:
         self.conn.commit()
 
     def get_scrape_progress(self) -> list[dict]:
-        rows = self.conn.execute("SELECT * FROM scrape_progress ORDER BY source, service, field").fetchall()
+        rows = self.conn.execute("SELECT * FROM scrape_progress ORDER BY source, service, field")
         return [dict(r) for r in rows]
 
     # ── Search / filter queries ──────────────────────────────────────
@@ -367,35 +411,36 @@ class Database:
             ORDER BY c.rating DESC NULLS LAST, c.reviews_count DESC NULLS LAST
             LIMIT ? OFFSET ?
         """
-        rows = self.conn.execute(data_sql, params + [limit, offset]).fetchall()
+        rows = self.conn.execute(data_sql, params + [limit, offset])
         return [dict(r) for r in rows], total
 
     def get_all_countries(self) -> list[str]:
         rows = self.conn.execute(
             "SELECT DISTINCT country FROM companies WHERE country IS NOT NULL AND country != '' ORDER BY country"
-        ).fetchall()
+        )
         return [r["country"] for r in rows]
 
     def get_all_services(self) -> list[str]:
-        rows = self.conn.execute("SELECT DISTINCT service FROM company_categories ORDER BY service").fetchall()
+        rows = self.conn.execute("SELECT DISTINCT service FROM company_categories ORDER BY service")
         return [r["service"] for r in rows]
 
     def get_fields_for_service(self, service: str) -> list[str]:
         rows = self.conn.execute(
             "SELECT DISTINCT field FROM company_categories WHERE service = ? ORDER BY field", (service,)
-        ).fetchall()
+        )
         return [r["field"] for r in rows]
 
     def get_stats(self) -> dict:
-        total = self.conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
-        with_email = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE email IS NOT NULL AND email != '' AND email != 'Unreachable'"
-        ).fetchone()[0]
-        with_contact_form = self.conn.execute(
-            "SELECT COUNT(*) FROM companies WHERE contact_form_url IS NOT NULL AND contact_form_url != ''"
-        ).fetchone()[0]
-        clutch = self.conn.execute("SELECT COUNT(*) FROM companies WHERE source = 'Clutch.co'").fetchone()[0]
-        sortlist = self.conn.execute("SELECT COUNT(*) FROM companies WHERE source = 'Sortlist.com'").fetchone()[0]
+        """Return dashboard counters, computed in a single pass over companies."""
+        row = self.conn.execute(
+            """SELECT COUNT(*),
+                      COALESCE(SUM(email IS NOT NULL AND email != '' AND email != 'Unreachable'), 0),
+                      COALESCE(SUM(contact_form_url IS NOT NULL AND contact_form_url != ''), 0),
+                      COALESCE(SUM(source = 'Clutch.co'), 0),
+                      COALESCE(SUM(source = 'Sortlist.com'), 0)
+               FROM companies"""
+        ).fetchone()
+        total, with_email, with_contact_form, clutch, sortlist = row
         return {
             "total": total, "with_email": with_email, "with_contact_form": with_contact_form,
             "clutch_count": clutch, "sortlist_count": sortlist,
@@ -41,56 +41,56 @@ MAX_ROWS_PER_SHEET = 1_000_000
 MAX_ROWS_PER_FILE = 50_000  # split into numbered files after this
 GMAIL_MAX_ATTACHMENT_MB = 25
 
+# Column order of the exported files: companies-table order, then the
+# aggregated category columns (the header of existing data/*.csv exports)
 DISPLAY_COLUMNS = [
-    "name", "email", "contact_form_url", "rating", "reviews_count",
-    "location", "country", "website_url", "profile_url", "services",
-    "source", "category", "sub_category",
-    "min_project", "hourly_rate", "employees", "team_size", "tagline",
+    "name", "profile_url", "rating", "reviews_count", "location", "country",
+    "website_url", "min_project", "hourly_rate", "employees", "team_size",
+    "tagline", "services", "source", "email", "contact_form_url",
+    "category", "sub_category",
 ]
 
+# category/sub_category are aggregated from company_categories; everything
+# else is read straight from companies.
+_COMPANY_SELECT = ", ".join(
+    f"c.{col}" for col in DISPLAY_COLUMNS if col not in ("category", "sub_category")
+)
+
 
 def load_data_by_service(db: Database) -> dict[str, tuple[pd.DataFrame, pd.DataFrame]]:
-    """Load companies grouped by service. Returns {service: (df_emails, df_forms)}."""
-    conn = db.conn
+    """Load companies grouped by service. Returns {service: (df_emails, df_forms)}.
 
-    services = [r[0] for r in conn.execute(
-        "SELECT DISTINCT service FROM company_categories ORDER BY service"
-    ).fetchall()]
+    One query covers every service; the frame is split per service and by
+    email/contact-form in pandas.
+    """
+    df = pd.read_sql_query(f"""
+        WITH cats AS (
+            SELECT company_id,
+                   GROUP_CONCAT(DISTINCT service) AS category,
+                   GROUP_CONCAT(DISTINCT field) AS sub_category
+            FROM company_categories
+            GROUP BY company_id
+        )
+        SELECT cs.service AS _service,
+               {_COMPANY_SELECT},
+               cats.category, cats.sub_category,
+               (c.email IS NOT NULL AND c.email != '' AND c.email != 'Unreachable') AS _has_email
+        FROM (SELECT DISTINCT company_id, service FROM company_categories) cs
+        JOIN companies c ON c.id = cs.company_id
+        JOIN cats ON cats.company_id = c.id
+        WHERE (c.email IS NOT NULL AND c.email != '' AND c.email != 'Unreachable')
+           OR (c.contact_form_url IS NOT NULL AND c.contact_form_url != '')
+        ORDER BY cs.service, c.rating DESC NULLS LAST, c.reviews_count DESC NULLS LAST
+    """, db.conn)
 
     result = {}
-    for service in services:
-        df_emails = pd.read_sql_query("""
-            SELECT c.*,
-                   GROUP_CONCAT(DISTINCT cc2.service) AS category,
-                   GROUP_CONCAT(DISTINCT cc2.field) AS sub_category
-            FROM companies c
-            JOIN company_categories cc ON cc.company_id = c.id AND cc.service = ?
-            LEFT JOIN company_categories cc2 ON cc2.company_id = c.id
-            WHERE c.email IS NOT NULL AND c.email != '' AND c.email != 'Unreachable'
-            GROUP BY c.id
-            ORDER BY c.rating DESC NULLS LAST, c.reviews_count DESC NULLS LAST
-        """, conn, params=(service,))
-
-        df_forms = pd.read_sql_query("""
-            SELECT c.*,
-                   GROUP_CONCAT(DISTINCT cc2.service) AS category,
-                   GROUP_CONCAT(DISTINCT cc2.field) AS sub_category
-            FROM companies c
-            JOIN company_categories cc ON cc.company_id = c.id AND cc.service = ?
-            LEFT JOIN company_categories cc2 ON cc2.company_id = c.id
-            WHERE (c.email IS NULL OR c.email = '' OR c.email = 'Unreachable')
-              AND c.contact_form_url IS NOT NULL AND c.contact_form_url != ''
-            GROUP BY c.id
-            ORDER BY c.rating DESC NULLS LAST, c.reviews_count DESC NULLS LAST
-        """, conn, params=(service,))
-
-        # Keep only display columns
-        for df in (df_emails, df_forms):
-            cols = [c for c in DISPLAY_COLUMNS if c in df.columns]
-            df.drop(columns=[c for c in df.columns if c not in cols], inplace=True)
-
-        if not df_emails.empty or not df_forms.empty:
-            result[service] = (df_emails, df_forms)
+    for service, group in df.groupby("_service", sort=True):
+        has_email = group["_has_email"].astype(bool)
+        group = group[DISPLAY_COLUMNS]
+        result[service] = (
+            group[has_email].reset_index(drop=True),
+            group[~has_email].reset_index(drop=True),
+        )
 
     return result
 
@@ -169,10 +169,10 @@ def send_via_email(
             msg["To"] = email_to
             msg["Subject"] = f"Scraping Export - {label}{part_label}"
 
-            body = f"{label}\n\nAttached files ({len(batch)}):\n"
-            for f in batch:
-                size_mb = f.stat().st_size / (1024 * 1024)
-                body += f"  - {f.name} ({size_mb:.1f} MB)\n"
+            body = "".join([
+                f"{label}\n\nAttached files ({len(batch)}):\n",
+                *(f"  - {f.name} ({f.stat().st_size / (1024 * 1024):.1f} MB)\n" for f in batch),
+            ])
             msg.attach(MIMEText(body, "plain"))
 
             for filepath in batch:
@@ -308,7 +308,7 @@ def main():
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     )
 
-    db = Database(args.db or DB_PATH)
+    db = Database(args.db or DB_PATH, read_only=True)
     db.connect()
     try:
         export_all(
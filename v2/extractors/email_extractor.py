@@ -9,12 +9,15 @@ Improvements over v1:
 
 import re
 import logging
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup
 
-# Import from the original config (shared with v1)
+# Import from the original config and extractor (shared with v1)
 from config.email_filters import extract_emails_from_text, filter_and_rank_emails
+from extractors.common import contact_rank, iter_links, parse_html, settle, site_key
+from extractors.email_extractor import fetch_html, may_contain_email
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +37,20 @@ CONTACT_PAGE_PATTERNS = [
     re.compile(r"/(get-in-touch|reach-us|support)", re.IGNORECASE),
 ]
 
+# All of the above as one alternation, so each path costs a single search
+CONTACT_PAGE_RE = re.compile(
+    "|".join(p.pattern for p in CONTACT_PAGE_PATTERNS), re.IGNORECASE
+)
+
 CONTACT_LINK_TEXT = re.compile(
     r"\b(contact|about|team|get.in.touch|reach.us|impressum|imprint|support)\b",
     re.IGNORECASE,
 )
 
+# The HTTP pass runs inline before the browser, one request after another,
+# so a slow site must fail fast and leave the rest to Playwright
+STATIC_PASS_TIMEOUT = 4  # seconds
+
 CONTACT_FORM_FIELD_TYPES = {"text", "email", "tel"}
 CONTACT_FORM_KEYWORDS = re.compile(
     r"(message|inquiry|enquiry|contact|comment|feedback|question|subject|your.?name|your.?email)",
@@ -54,6 +66,9 @@ class EmailExtractor:
 
     def __init__(self, page):
         self._page = page
+        # Results with an email, per site (see site_key); listings often repeat
+        # a company site. Misses aren't stored, so a transient failure can be retried.
+        self._result_by_site: dict[str, tuple[str, str]] = {}
 
     def find_email(self, website_url: str) -> tuple[str, str]:
         """Visit a company website and try to find a contact email.
@@ -66,12 +81,50 @@ class EmailExtractor:
         if not website_url or not website_url.startswith("http"):
             return ("Unreachable", "")
 
+        key = site_key(website_url)
+        cached = self._result_by_site.get(key)
+        if cached is not None:
+            logger.info("Reusing result for %s: %s", key, cached[0])
+            return cached
+
+        result = self._fetch_static(website_url) or self._visit_site(website_url)
+        if result[0] != "Unreachable":
+            self._result_by_site[key] = result
+        return result
+
+    def _fetch_static(self, website_url: str) -> tuple[str, str] | None:
+        """Try the landing and contact pages over plain HTTP, without the browser.
+
+        Returns (email, "") on a hit, else None so the caller falls back to
+        Playwright (which also handles JS-rendered pages and contact forms).
+        A failed landing fetch ends the pass; its contact pages aren't tried.
+        """
+        html = fetch_html(website_url, timeout=STATIC_PASS_TIMEOUT)
+        if html is None:
+            return None
+
+        email = self._extract_best_email(html)
+        if email:
+            logger.info("Found email over HTTP: %s", email)
+            return (email, "")
+
+        for contact_url in self._find_contact_page_urls(html, website_url)[:3]:
+            contact_html = fetch_html(contact_url, timeout=STATIC_PASS_TIMEOUT)
+            if contact_html:
+                email = self._extract_best_email(contact_html)
+                if email:
+                    logger.info("Found email over HTTP on contact page: %s", email)
+                    return (email, "")
+
+        return None
+
+    def _visit_site(self, website_url: str) -> tuple[str, str]:
         contact_form_url = ""
 
         try:
             logger.info("Checking landing page: %s", website_url)
             self._page.goto(website_url, wait_until="domcontentloaded", timeout=15000)
-            self._page.wait_for_timeout(2000)
+            settle(self._page, 2000)
 
             html = self._page.content()
             email = self._extract_best_email(html)
@@ -87,7 +140,7 @@ class EmailExtractor:
                 try:
                     logger.info("Checking contact page: %s", contact_url)
                     self._page.goto(contact_url, wait_until="domcontentloaded", timeout=10000)
-                    self._page.wait_for_timeout(1500)
+                    settle(self._page, 1500)
 
                     html = self._page.content()
                     email = self._extract_best_email(html)
@@ -110,13 +163,15 @@ class EmailExtractor:
 
     def _extract_best_email(self, html: str) -> str | None:
         all_emails = []
+        # Without an "@" only the obfuscation decoder (atob etc.) can find one
+        has_at = may_contain_email(html)
+        doc = parse_html(html) if has_at else None
 
-        soup = BeautifulSoup(html, "lxml")
-        for link in soup.select('a[href^="mailto:"]'):
-            href = link.get("href", "")
-            email = href.replace("mailto:", "").split("?")[0].strip()
-            if email:
-                all_emails.append(email)
+        if doc is not None:
+            for href in doc.xpath('//a[starts-with(@href, "mailto:")]/@href'):
+                email = href.replace("mailto:", "").split("?")[0].strip()
+                if email:
+                    all_emails.append(email)
 
         if _scrape_obfuscated is not None:
             try:
@@ -126,13 +181,16 @@ class EmailExtractor:
             except Exception:
                 pass
 
-        text_emails = extract_emails_from_text(soup.get_text())
-        all_emails.extend(text_emails)
+        # One regex pass over the source, which contains the page text
+        if has_at:
+            all_emails.extend(extract_emails_from_text(html))
 
-        html_emails = extract_emails_from_text(html)
-        all_emails.extend(html_emails)
+        email = filter_and_rank_emails(all_emails)
+        if email or doc is None:
+            return email
 
-        return filter_and_rank_emails(all_emails)
+        # Tag-split addresses only show up in the extracted text
+        return filter_and_rank_emails(extract_emails_from_text(doc.text_content()))
 
     def _has_contact_form(self, html: str) -> bool:
         soup = BeautifulSoup(html, "lxml")
@@ -165,47 +223,33 @@ class EmailExtractor:
         return False
 
     def _find_contact_page_urls(self, html: str, base_url: str) -> list[str]:
-        soup = BeautifulSoup(html, "lxml")
         candidates = []
         base_domain = urlparse(base_url).netloc
 
-        for a_tag in soup.find_all("a", href=True):
+        for a_tag in iter_links(html):
             href = a_tag.get("href", "").strip()
             if not href or href.startswith("#") or href.startswith("javascript:"):
                 continue
             full_url = urljoin(base_url, href)
-            if urlparse(full_url).netloc != base_domain:
+            parsed = urlparse(full_url)
+            if parsed.netloc != base_domain:
                 continue
 
-            path = urlparse(full_url).path
-            matched = False
-            for pattern in CONTACT_PAGE_PATTERNS:
-                if pattern.search(path):
-                    candidates.append(full_url)
-                    matched = True
-                    break
-            if not matched:
-                link_text = a_tag.get_text(strip=True)
+            path = parsed.path
+            if CONTACT_PAGE_RE.search(path):
+                candidates.append((full_url, path))
+            else:
+                link_text = a_tag.text_content().strip()
                 if link_text and CONTACT_LINK_TEXT.search(link_text):
-                    candidates.append(full_url)
+                    candidates.append((full_url, path))
 
         seen = set()
-        unique = []
-        for url in candidates:
+        ranked = []
+        for url, path in candidates:
             normalized = url.rstrip("/").lower()
             if normalized not in seen:
                 seen.add(normalized)
-                unique.append(url)
-
-        def sort_key(u):
-            p = urlparse(u).path.lower()
-            if "contact" in p:
-                return 0
-            if "about" in p:
-                return 1
-            if "team" in p:
-                return 2
-            return 3
-
-        unique.sort(key=sort_key)
-        return unique
+                ranked.append((contact_rank(path), url))
+
+        ranked.sort(key=itemgetter(0))
+        return [url for _, url in ranked]
@@ -35,6 +35,7 @@ from v2.db.database import Database
 from v2.extractors.email_extractor import EmailExtractor
 from v2.export_data import export_all
 
+from scrapers.base import BaseScraper
 from scrapers.clutch import ClutchScraper
 from scrapers.sortlist import SortlistScraper
 
@@ -50,6 +51,8 @@ if sys.platform == "win32":
 
 logger = logging.getLogger(__name__)
 
+WRITE_BATCH_SIZE = 100  # companies buffered per SQLite transaction
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -93,6 +96,7 @@ def main():
         if not args.no_export:
             _export_and_send(db, output_dir)
     finally:
+        BaseScraper.shutdown_shared()
         db.close()
         logger.info("Done.")
 
@@ -148,6 +152,7 @@ def _run_loop(
         logger.info("=" * 70)
 
         # ── 5. Wait ───────────────────────────────────────────────
+        BaseScraper.shutdown_shared()  # don't keep Chromium idle for hours
         time.sleep(interval_secs)
 
 
@@ -199,6 +204,7 @@ def _scrape_batch(db: Database, site_filter: str | None, max_pages: int, proxy:
         _sortlist_mod.MAX_PAGES = max_limit
 
         scraper = _create_scraper(source, proxy)
+        pending_rows: list[dict] = []
         try:
             scraper.start_browser()
             company_count = 0
@@ -206,12 +212,17 @@ def _scrape_batch(db: Database, site_filter: str | None, max_pages: int, proxy:
             for company_data in scraper.scrape_category(url, start_page=start_page):
                 if not company_data.get("name"):
                     continue
-                company_id = db.upsert_company(company_data)
-                db.add_category(company_id, service, field, source)
+                pending_rows.append(company_data)
                 company_count += 1
+                if len(pending_rows) >= WRITE_BATCH_SIZE:
+                    db.save_companies(pending_rows, service, field, source)
+                    pending_rows.clear()
                 if company_count % 25 == 0:
                     logger.info("  ... %d companies so far", company_count)
 
+            db.save_companies(pending_rows, service, field, source)
+            pending_rows.clear()
+
             if company_count == 0:
                 db.mark_task_completed(source, service, field, 0)
                 logger.info("Completed (no more pages): %s > %s", service, field)
@@ -223,6 +234,7 @@ def _scrape_batch(db: Database, site_filter: str | None, max_pages: int, proxy:
 
         except Exception as e:
             logger.error("FAILED [%s] %s > %s: %s", source, service, field, e, exc_info=True)
+            _save_scraped_rows(db, pending_rows, service, field, source)  # keep what was scraped
             db.mark_task_failed(source, service, field, str(e))
         finally:
             scraper.close_browser()
@@ -238,6 +250,28 @@ def _scrape_batch(db: Database, site_filter: str | None, max_pages: int, proxy:
     return True
 
 
+def _save_scraped_rows(db: Database, rows: list[dict], service: str, field: str, source: str) -> None:
+    """Best-effort save of the rows buffered when a task failed; never raises.
+
+    Tries one batch first. If that fails (the failure may have come from the
+    batch save itself), each row is saved on its own so one bad row doesn't
+    discard the rest.
+    """
+    if not rows:
+        return
+    try:
+        db.save_companies(rows, service, field, source)
+        return
+    except Exception as e:
+        logger.warning("Batch save of %d companies failed (%s); saving one at a time", len(rows), e)
+
+    for row in rows:
+        try:
+            db.save_companies([row], service, field, source)
+        except Exception as e:
+            logger.warning("Could not save company %r: %s", row.get("name"), e)
+
+
 def _extract_emails(db: Database, proxy: str = ""):
     """Extract emails for all companies that haven't been processed yet."""
     companies = db.get_pending_email_companies()
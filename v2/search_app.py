@@ -8,6 +8,7 @@ import subprocess
 import sys
 import os
 import logging
+from collections import Counter
 
 # Ensure project root is on sys.path so both `v2.*` and `utils.*` imports work
 # regardless of how Streamlit launches this file.
@@ -31,8 +32,10 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
 def get_db():
-    db = Database()
+    """Open the database once per server process and reuse it across reruns."""
+    db = Database(read_only=True)
     db.connect()
     return db
 
@@ -193,11 +196,11 @@ def render_admin_page(db: Database):
         )
 
         # Summary counts
-        total_tasks = len(progress)
-        completed = sum(1 for p in progress if p["status"] == "completed")
-        failed = sum(1 for p in progress if p["status"] == "failed")
-        pending = sum(1 for p in progress if p["status"] == "pending")
-        st.caption(f"Tasks: {completed} completed, {failed} failed, {pending} pending / {total_tasks} total")
+        status_counts = Counter(p["status"] for p in progress)
+        st.caption(
+            f"Tasks: {status_counts['completed']} completed, {status_counts['failed']} failed, "
+            f"{status_counts['pending']} pending / {len(progress)} total"
+        )
     else:
         st.info("No scrape data yet. Run the scraper first.")
 